@@ -5,14 +5,126 @@ Cleans and normalizes text extracted from OCR for optimal translation quality.
 """
 
 import re
+import threading
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
+# Optional DFA-based matcher for faster artifact scanning
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+# Paragraph separator: a blank line, optionally containing whitespace
+_RE_PARA_SPLIT = re.compile(r'\n\s*\n')
+
+# Word hyphenated across a line break ("bro-\nken")
+_RE_HYPHEN_BREAK = re.compile(r'(\w+)-\s*\n\s*(\w+)')
+
+# Line ending without punctuation followed by a lowercase continuation line
+_RE_LINE_CONTINUATION = re.compile(r'([^.!?:;,\s])[^\S\n]*\n[^\S\n]*([a-z])')
+
+# Single special character not touching a word, likely an OCR artifact.
+# The character class comes first so the engine can skip ahead to candidate
+# characters; the lookbehind then checks the character before it.
+_RE_ISOLATED_SPECIAL = re.compile(r'[^\w\s,.:;!?\'\"()\[\]{}<>@#$%&*+-=/\\](?<!\w.)(?!\w)')
+
+# Whitespace normalization passes; single spaces are left untouched
+_RE_INTRALINE_WS = re.compile(r'[ \t]{2,}|\t')
+_RE_MULTI_BLANK = re.compile(r'\n{3,}')
+_RE_ANY_WS = re.compile(r'\s+')
+
+# Whitespace that _normalize_whitespace would change, per mode
+_RE_UNCLEAN_WS_LINES = re.compile(r'[ \t]{2,}|\t|[^\S\n]\n|\n[^\S\n]|\n{3,}')
+_RE_UNCLEAN_WS_FLAT = re.compile(r'\s\s|[^\S ]')
+
+# Context-aware OCR corrections, combined into one alternation.
+# Each named group maps to its replacement in _OCR_FIX_REPLACEMENTS.
+_RE_OCR_FIX = re.compile(
+    # "rn" that should be "m" in common words
+    r'(?P<rn>(?i:\brn(?=ake|any|ore|ost|uch|y\b)'
+    r'|(?<=co)rn(?=puter|pany|mon)'
+    r'|(?<=su)rn(?=mit|mer|mary)))'
+    # "0" that should be "O" inside a word
+    r'|(?P<zero>(?<=[a-zA-Z])0(?=[a-zA-Z]))'
+    # "1" at the beginning of a word is likely "I"
+    r'|(?P<one_start>(?<!\S)1(?=[a-z]))'
+    # "1" in the middle of a word is likely "l"
+    r'|(?P<one_mid>(?<=[a-zA-Z])1(?=[a-zA-Z]))'
+)
+
+_OCR_FIX_REPLACEMENTS = {
+    'rn': 'm',
+    'zero': 'O',
+    'one_start': 'I',
+    'one_mid': 'l',
+}
+
+
+# Characters that are typically OCR artifacts (one character class)
+_ARTIFACT_CHARS = (
+    r'['
+    r'\x00-\x08\x0b\x0c\x0e-\x1f'  # Control characters
+    r'¬¦§¨©ª«®¯°±²³´µ¶·¸¹º»¼½¾¿'  # Common OCR noise
+    r'\uf000-\uffff'  # Private use area characters
+    r']'
+)
+_RE_ARTIFACT = re.compile(_ARTIFACT_CHARS)
+
+# Characters other than letters, digits, whitespace and basic punctuation
+_RE_SPECIAL_CHAR = re.compile(r'[^a-zA-Z0-9\s.,!?\'"-]')
+
+
+def _ocr_fix_replacement(match: "re.Match[str]") -> str:
+    """Return the correction for a match of _RE_OCR_FIX."""
+    return _OCR_FIX_REPLACEMENTS[match.lastgroup]
+
+
+# Scores are memoized, since a static scene yields the same OCR text
+# frame after frame
+@lru_cache(maxsize=512)
+def _estimate_quality(text: str) -> float:
+    """Score OCR text quality from 0.0 to 1.0; see TextProcessor.estimate_quality."""
+    if not text:
+        return 0.0
+    
+    score = 1.0
+    
+    # Penalize high artifact count
+    artifact_count = len(_RE_ARTIFACT.findall(text))
+    if artifact_count > 0:
+        score -= min(0.3, artifact_count * 0.02)
+    
+    # Penalize very short or very long words
+    words = text.split()
+    if words:
+        avg_word_length = sum(len(w) for w in words) / len(words)
+        if avg_word_length < 2 or avg_word_length > 15:
+            score -= 0.2
+    
+    # Penalize excessive special characters
+    special_ratio = len(_RE_SPECIAL_CHAR.findall(text)) / max(len(text), 1)
+    if special_ratio > 0.1:
+        score -= min(0.3, special_ratio * 2)
+    
+    # Penalize lack of spaces (likely merged text)
+    if len(text) > 50:
+        space_ratio = text.count(' ') / len(text)
+        if space_ratio < 0.05:
+            score -= 0.3
+    
+    return max(0.0, min(1.0, score))
+
 
 @dataclass
 class ProcessedText:
     """Result of text processing."""
+    __slots__ = ('original', 'processed', 'removed_artifacts', 'corrections_made')
+    
     original: str
     processed: str
     removed_artifacts: List[str]
@@ -41,27 +153,21 @@ class TextProcessor:
         print(result.processed)
     """
     
-    # Common OCR substitution errors
-    OCR_CORRECTIONS = {
-        # Number/letter confusion
-        "0": {"O", "o", "Q"},
-        "1": {"l", "I", "|", "!"},
-        "5": {"S", "s"},
-        "8": {"B"},
-        
-        # Common misreads
-        "rn": {"m"},
-        "cl": {"d"},
-        "vv": {"w"},
-        "li": {"h"},
-    }
+    # Characters that are typically OCR artifacts (one character class)
+    ARTIFACT_CHARS = _ARTIFACT_CHARS
     
-    # Characters that are typically OCR artifacts
-    ARTIFACT_PATTERNS = [
-        r'[\x00-\x08\x0b\x0c\x0e-\x1f]',  # Control characters
-        r'[¬¦§¨©ª«®¯°±²³´µ¶·¸¹º»¼½¾¿]',  # Common OCR noise
-        r'[\uf000-\uffff]',  # Private use area characters
-    ]
+    # Common Unicode variants and their ASCII equivalents
+    UNICODE_REPLACEMENTS = {
+        '\u2018': "'",  # Left single quote
+        '\u2019': "'",  # Right single quote
+        '\u201c': '"',  # Left double quote
+        '\u201d': '"',  # Right double quote
+        '\u2014': '-',  # Em dash
+        '\u2013': '-',  # En dash
+        '\u2026': '...',  # Ellipsis
+        '\u00a0': ' ',  # Non-breaking space
+        '\ufeff': '',  # BOM
+    }
     
     def __init__(
         self,
@@ -87,10 +193,36 @@ class TextProcessor:
         self.remove_artifacts = remove_artifacts
         self.preserve_newlines = preserve_newlines
         
-        # Compile artifact patterns
-        self._artifact_regex = re.compile(
-            '|'.join(self.ARTIFACT_PATTERNS)
-        )
+        # Compile artifact pattern
+        self._artifact_regex = re.compile(self.ARTIFACT_CHARS)
+        
+        # The same pattern restricted to ASCII, as a str.translate deletion table
+        self._ascii_artifact_table = {
+            code: None for code in range(128) if self._artifact_regex.match(chr(code))
+        }
+        
+        # Hyperscan database for the same pattern, if available. A scan
+        # needs scratch space of its own, so each thread gets one.
+        self._hs_db = None
+        self._hs_local = threading.local()
+        if HYPERSCAN_AVAILABLE and remove_artifacts:
+            self._hs_db = self._compile_hyperscan_db()
+    
+    def _compile_hyperscan_db(self) -> Optional["hyperscan.Database"]:
+        """Compile ARTIFACT_CHARS into a Hyperscan database."""
+        # Hyperscan spells code points as \x{....} instead of \u....
+        pattern = re.sub(r'\\u([0-9a-fA-F]{4})', r'\\x{\1}', self.ARTIFACT_CHARS)
+        
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[pattern.encode('utf-8')],
+                ids=[0],
+                flags=[hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SOM_LEFTMOST]
+            )
+            return db
+        except hyperscan.error:
+            return None
     
     def process(self, text: str) -> ProcessedText:
         """
@@ -110,6 +242,15 @@ class TextProcessor:
                 corrections_made=0
             )
         
+        # Already-clean text (e.g. a previous result) needs no work
+        if self._is_already_clean(text):
+            return ProcessedText(
+                original=text,
+                processed=text,
+                removed_artifacts=[],
+                corrections_made=0
+            )
+        
         original = text
         removed_artifacts = []
         corrections_made = 0
@@ -145,146 +286,165 @@ class TextProcessor:
             corrections_made=corrections_made
         )
     
-    def _remove_artifacts(self, text: str) -> Tuple[str, List[str]]:
-        """Remove OCR artifact characters."""
-        removed = []
+    def process_bytes(self, data: bytes, encoding: str = 'utf-8') -> ProcessedText:
+        """
+        Process raw OCR output given as bytes.
+        
+        The data is decoded once (undecodable bytes become U+FFFD) and then
+        processed as text. The cleaning patterns rely on Unicode word and
+        whitespace classes, so they are not run on the encoded bytes.
+        
+        Args:
+            data: The raw OCR text as bytes.
+            encoding: The encoding of data.
+            
+        Returns:
+            ProcessedText with cleaned text and processing details.
+        """
+        return self.process(data.decode(encoding, errors='replace'))
+    
+    def _is_already_clean(self, text: str) -> bool:
+        """
+        Check whether every enabled processing step would leave text unchanged.
+        
+        Each probe is a search that stops at the first hit, which is much
+        cheaper than running the substitutions themselves.
+        """
+        if text[0].isspace() or text[-1].isspace():
+            return False
+        
+        if self.remove_artifacts and (
+            self._artifact_regex.search(text) or _RE_ISOLATED_SPECIAL.search(text)
+        ):
+            return False
+        
+        if not text.isascii():
+            if not unicodedata.is_normalized('NFC', text):
+                return False
+            if any(old in text for old in self.UNICODE_REPLACEMENTS):
+                return False
+        
+        if self.fix_common_errors and _RE_OCR_FIX.search(text):
+            return False
         
-        # Find all artifacts
-        for match in self._artifact_regex.finditer(text):
-            removed.append(match.group())
+        if self.merge_broken_words and (
+            _RE_HYPHEN_BREAK.search(text) or _RE_LINE_CONTINUATION.search(text)
+        ):
+            return False
         
-        # Remove them
-        cleaned = self._artifact_regex.sub('', text)
+        if self.normalize_whitespace:
+            if self.preserve_newlines:
+                unclean_ws = _RE_UNCLEAN_WS_LINES
+            else:
+                unclean_ws = _RE_UNCLEAN_WS_FLAT
+            if unclean_ws.search(text):
+                return False
+        
+        return True
+    
+    def _remove_artifacts(self, text: str) -> Tuple[str, List[str]]:
+        """Remove OCR artifact characters."""
+        cleaned = None
+        if self._hs_db is not None:
+            cleaned, removed = self._remove_artifacts_hyperscan(text)
+        
+        if cleaned is None:
+            # Find all artifacts, then remove them
+            removed = self._artifact_regex.findall(text)
+            if not removed:
+                cleaned = text
+            elif text.isascii():
+                # Deleting ASCII characters with str.translate is much
+                # faster than re.sub (it is slower on non-ASCII text)
+                cleaned = text.translate(self._ascii_artifact_table)
+            else:
+                cleaned = self._artifact_regex.sub('', text)
         
         # Also remove isolated single special characters
         # that are likely artifacts
-        cleaned = re.sub(r'(?<!\w)[^\w\s,.:;!?\'\"()\[\]{}<>@#$%&*+-=/\\](?!\w)', '', cleaned)
+        cleaned = _RE_ISOLATED_SPECIAL.sub('', cleaned)
         
         return cleaned, removed
     
+    def _remove_artifacts_hyperscan(self, text: str) -> Tuple[Optional[str], List[str]]:
+        """
+        Remove artifact characters using the Hyperscan database.
+        
+        Returns (None, []) if the text cannot be scanned as UTF-8
+        (e.g. lone surrogates) or the scan fails, so the caller can fall
+        back to re.
+        """
+        try:
+            data = text.encode('utf-8')
+        except UnicodeEncodeError:
+            return None, []
+        
+        spans = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            spans.append((start, end))
+        
+        try:
+            scratch = getattr(self._hs_local, 'scratch', None)
+            if scratch is None:
+                scratch = self._hs_local.scratch = hyperscan.Scratch(self._hs_db)
+            self._hs_db.scan(data, match_event_handler=on_match, scratch=scratch)
+        except hyperscan.error:
+            return None, []
+        
+        if not spans:
+            return text, []
+        
+        # Copy the kept byte ranges into one buffer
+        removed = []
+        buffer = bytearray()
+        position = 0
+        for start, end in spans:
+            buffer += data[position:start]
+            removed.append(data[start:end].decode('utf-8'))
+            position = end
+        buffer += data[position:]
+        
+        return buffer.decode('utf-8'), removed
+    
     def _normalize_unicode(self, text: str) -> str:
         """Normalize Unicode characters to their canonical forms."""
         # Normalize to NFC form (composed characters)
         text = unicodedata.normalize('NFC', text)
         
         # Replace common Unicode variants with ASCII equivalents
-        replacements = {
-            '\u2018': "'",  # Left single quote
-            '\u2019': "'",  # Right single quote
-            '\u201c': '"',  # Left double quote
-            '\u201d': '"',  # Right double quote
-            '\u2014': '-',  # Em dash
-            '\u2013': '-',  # En dash
-            '\u2026': '...',  # Ellipsis
-            '\u00a0': ' ',  # Non-breaking space
-            '\ufeff': '',  # BOM
-        }
-        
-        for old, new in replacements.items():
+        for old, new in self.UNICODE_REPLACEMENTS.items():
             text = text.replace(old, new)
         
         return text
     
     def _fix_ocr_errors(self, text: str) -> Tuple[str, int]:
         """Fix common OCR character substitution errors."""
-        corrections = 0
-        
-        # Context-aware corrections
-        words = text.split()
-        corrected_words = []
-        
-        for word in words:
-            original_word = word
-            
-            # Fix common patterns
-            # "rn" that should be "m"
-            if 'rn' in word.lower():
-                # Check if this looks like it should be 'm'
-                word = self._try_correct_rn(word)
-            
-            # "0" that should be "O" in words
-            if '0' in word and re.search(r'[a-zA-Z]', word):
-                word = re.sub(r'(?<=[a-zA-Z])0(?=[a-zA-Z])', 'O', word)
-            
-            # "1" that should be "l" or "I"
-            if '1' in word and re.search(r'[a-zA-Z]', word):
-                # Beginning of word likely "I"
-                word = re.sub(r'^1(?=[a-z])', 'I', word)
-                # Middle of word likely "l"
-                word = re.sub(r'(?<=[a-zA-Z])1(?=[a-zA-Z])', 'l', word)
-            
-            if word != original_word:
-                corrections += 1
-            
-            corrected_words.append(word)
-        
-        return ' '.join(corrected_words), corrections
-    
-    def _try_correct_rn(self, word: str) -> str:
-        """Try to correct 'rn' to 'm' based on context."""
-        # Common words where 'rn' should be 'm'
-        rn_to_m_patterns = [
-            (r'\brn(?=ake|any|ore|ost|uch|y\b)', 'm'),
-            (r'(?<=co)rn(?=puter|pany|mon)', 'm'),
-            (r'(?<=su)rn(?=mit|mer|mary)', 'm'),
-        ]
-        
-        result = word
-        for pattern, replacement in rn_to_m_patterns:
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-        
-        return result
+        # All context-aware corrections run in a single pass over the text
+        return _RE_OCR_FIX.subn(_ocr_fix_replacement, text)
     
     def _merge_broken_words(self, text: str) -> str:
         """Merge words that were broken across lines."""
         # Pattern: word ending with hyphen followed by newline and continuation
-        text = re.sub(r'(\w+)-\s*\n\s*(\w+)', r'\1\2', text)
+        text = _RE_HYPHEN_BREAK.sub(r'\1\2', text)
         
         # Pattern: word split across lines (no hyphen)
-        # Only merge if the parts form a likely word
-        lines = text.split('\n')
-        merged_lines = []
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].rstrip()
-            
-            # Check if line ends with an incomplete word
-            if i < len(lines) - 1 and line and not line[-1] in '.!?:;,':
-                next_line = lines[i + 1].lstrip()
-                
-                # Check if next line starts with lowercase (continuation)
-                if next_line and next_line[0].islower():
-                    # Likely a continuation
-                    merged_lines.append(line + ' ' + next_line)
-                    i += 2
-                    continue
-            
-            merged_lines.append(line)
-            i += 1
-        
-        return '\n'.join(merged_lines)
+        # Join when the line ends without punctuation and the next one
+        # starts with a lowercase letter (likely a continuation)
+        return _RE_LINE_CONTINUATION.sub(r'\1 \2', text)
     
     def _normalize_whitespace(self, text: str, preserve_newlines: bool) -> str:
         """Normalize whitespace in text."""
         if preserve_newlines:
             # Normalize spaces within lines but preserve paragraph breaks
-            lines = text.split('\n')
-            normalized_lines = []
-            
-            for line in lines:
-                # Normalize multiple spaces to single space
-                line = re.sub(r'[ \t]+', ' ', line)
-                # Remove leading/trailing whitespace
-                line = line.strip()
-                normalized_lines.append(line)
-            
+            text = _RE_INTRALINE_WS.sub(' ', text)
+            # Remove leading/trailing whitespace of each line
+            text = '\n'.join([line.strip() for line in text.split('\n')])
             # Collapse multiple empty lines to single empty line
-            text = '\n'.join(normalized_lines)
-            text = re.sub(r'\n{3,}', '\n\n', text)
+            text = _RE_MULTI_BLANK.sub('\n\n', text)
         else:
             # Replace all whitespace with single spaces
-            text = re.sub(r'\s+', ' ', text)
+            text = _RE_ANY_WS.sub(' ', text)
         
         return text
     
@@ -298,11 +458,9 @@ class TextProcessor:
         Returns:
             List of paragraph strings.
         """
-        # Split on double newlines
-        paragraphs = re.split(r'\n\s*\n', text)
-        
-        # Clean each paragraph
-        return [p.strip() for p in paragraphs if p.strip()]
+        # Split on blank lines, stripping each part only once
+        parts = (p.strip() for p in _RE_PARA_SPLIT.split(text))
+        return [p for p in parts if p]
     
     def estimate_quality(self, text: str) -> float:
         """
@@ -316,32 +474,4 @@ class TextProcessor:
         Returns:
             Quality score between 0.0 and 1.0.
         """
-        if not text:
-            return 0.0
-        
-        score = 1.0
-        
-        # Penalize high artifact count
-        artifact_count = len(self._artifact_regex.findall(text))
-        if artifact_count > 0:
-            score -= min(0.3, artifact_count * 0.02)
-        
-        # Penalize very short or very long words
-        words = text.split()
-        if words:
-            avg_word_length = sum(len(w) for w in words) / len(words)
-            if avg_word_length < 2 or avg_word_length > 15:
-                score -= 0.2
-        
-        # Penalize excessive special characters
-        special_ratio = len(re.findall(r'[^a-zA-Z0-9\s.,!?\'"-]', text)) / max(len(text), 1)
-        if special_ratio > 0.1:
-            score -= min(0.3, special_ratio * 2)
-        
-        # Penalize lack of spaces (likely merged text)
-        if len(text) > 50:
-            space_ratio = text.count(' ') / len(text)
-            if space_ratio < 0.05:
-                score -= 0.3
-        
-        return max(0.0, min(1.0, score))
+        return _estimate_quality(text)
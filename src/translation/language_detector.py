@@ -4,6 +4,7 @@ Language Detector
 Detects the source language of text for automatic translation.
 """
 
+import re
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
@@ -18,6 +19,8 @@ except ImportError:
 @dataclass
 class DetectionResult:
     """Result of language detection."""
+    __slots__ = ('language', 'confidence', 'alternatives')
+    
     language: str
     confidence: float
     alternatives: List[Tuple[str, float]]
@@ -84,6 +87,11 @@ LANGUAGE_NAMES = {
 }
 
 
+def _char_class(ranges: List[Tuple[int, int]]) -> str:
+    """Build a regex character class matching the given code point ranges."""
+    return '[' + ''.join(f'\\u{start:04x}-\\u{end:04x}' for start, end in ranges) + ']'
+
+
 class LanguageDetector:
     """
     Language detector for automatic source language detection.
@@ -114,6 +122,15 @@ class LanguageDetector:
         ],
     }
     
+    # Compiled patterns for CJK_RANGES, per language and combined
+    _CJK_PATTERNS = {
+        lang: re.compile(_char_class(ranges))
+        for lang, ranges in CJK_RANGES.items()
+    }
+    _ANY_CJK = re.compile(_char_class(
+        [span for ranges in CJK_RANGES.values() for span in ranges]
+    ))
+    
     def __init__(self, fallback_language: str = 'en'):
         """
         Initialize the language detector.
@@ -197,24 +214,18 @@ class LanguageDetector:
         
         This is more reliable than langdetect for short CJK texts.
         """
-        counts = {'ja': 0, 'zh': 0, 'ko': 0}
-        total_cjk = 0
-        
-        for char in text:
-            code = ord(char)
-            
-            for lang, ranges in self.CJK_RANGES.items():
-                for start, end in ranges:
-                    if start <= code <= end:
-                        counts[lang] += 1
-                        total_cjk += 1
-                        break
-        
-        if total_cjk == 0:
+        # Most text has no CJK characters at all; skip counting for it
+        if not self._ANY_CJK.search(text):
             return None
         
+        counts = {
+            lang: len(pattern.findall(text))
+            for lang, pattern in self._CJK_PATTERNS.items()
+        }
+        total_cjk = sum(counts.values())
+        
         # Calculate ratios
-        total_chars = len([c for c in text if not c.isspace()])
+        total_chars = len(''.join(text.split()))
         if total_chars == 0:
             return None
         
@@ -5,10 +5,23 @@ Client for communicating with ZenMux API for translation services.
 """
 
 import asyncio
+import concurrent.futures
+import hashlib
+import inspect
+import json
 import logging
+import math
+import random
+import re
+import sqlite3
+import threading
 import time
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple, Union
 
 try:
     from openai import OpenAI, AsyncOpenAI
@@ -23,12 +36,30 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .prompt_builder import PromptBuilder, TranslationStyle
 from .language_detector import LanguageDetector
+from .rate_limiter import TokenBucket
+from .translation_store import DEFAULT_STORE_PATH, TranslationStore
 
 
 logger = logging.getLogger(__name__)
 
+# Batch responses: '---' separator lines and the prompt's [i] item markers
+_RE_BATCH_SEPARATOR = re.compile(r'^[ \t]*---[ \t]*$', re.MULTILINE)
+_RE_BATCH_MARKER = re.compile(r'^\[\d+\][ \t]*')
+_RE_BATCH_MARKER_SPLIT = re.compile(r'^[ \t]*\[\d+\][ \t]*', re.MULTILINE)
+
+# Untranslatable text: any letter (word character other than digits and _)
+# marks text as translatable, unless it is a single bare URL
+_RE_HAS_LETTER = re.compile(r'[^\W\d_]')
+_RE_BARE_URL = re.compile(r'\s*(?:https?://|www\.)\S+\s*\Z', re.IGNORECASE)
+
 
 @dataclass
 class TranslationResult:
@@ -49,6 +80,29 @@ class TranslationResult:
         return bool(self.translated_text and self.translated_text.strip())
 
 
+# Stateless helpers shared by all clients
+_PROMPT_BUILDER = PromptBuilder()
+_LANGUAGE_DETECTOR = LanguageDetector()
+
+# Memoized per text so repeated texts (e.g. the same text into several
+# target languages) are only detected once
+_detect_language = lru_cache(maxsize=512)(_LANGUAGE_DETECTOR.detect)
+
+
+def _dump_result(result: TranslationResult) -> str:
+    """Serialize a TranslationResult to JSON for the Redis and disk caches."""
+    if ORJSON_AVAILABLE:
+        # orjson serializes dataclasses natively, without asdict()'s deep copy
+        return orjson.dumps(result).decode('utf-8')
+    return json.dumps(asdict(result))
+
+
+def _load_result(payload: Any) -> TranslationResult:
+    """Deserialize a TranslationResult from _dump_result() output."""
+    data = orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+    return TranslationResult(**data)
+
+
 class LLMClientError(Exception):
     """Exception raised when LLM API call fails."""
     pass
@@ -59,10 +113,17 @@ class LLMClient:
     Client for LLM-powered translation via ZenMux API.
     
     Features:
-    - Automatic retry with exponential backoff
-    - Response caching for repeated texts
+    - Automatic retry with jittered exponential backoff and Retry-After
+    - Bounded LRU response cache with expiry for repeated texts
+    - Optional shared Redis cache behind the in-memory cache
+    - Optional on-disk cache persistence across restarts
     - Language detection integration
     - Async and sync operation modes
+    - Bounded concurrency for async batch translation
+    - Short texts batched into a single request
+    - No API calls for text without anything to translate
+    - Duplicate in-flight requests share a single API call
+    - Optional token-bucket rate limiting of API requests
     
     Usage:
         client = LLMClient(api_key="sk-...", base_url="https://zenmux.ai/api/v1")
@@ -73,6 +134,16 @@ class LLMClient:
     DEFAULT_BASE_URL = "https://zenmux.ai/api/v1"
     DEFAULT_MODEL = "deepseek/deepseek-v3.2"
     
+    # Version of the cache key format; bump it when the format changes
+    CACHE_KEY_VERSION = "v2"
+    
+    # Completion tokens per batch item for the "[i] " marker and "---"
+    # separator the model echoes around each translation, with some slack
+    BATCH_ITEM_OVERHEAD_TOKENS = 8
+    
+    # Longest Retry-After to honor, so a bad header can't stall a request
+    MAX_RETRY_AFTER = 60.0
+    
     def __init__(
         self,
         api_key: str,
@@ -80,7 +151,13 @@ class LLMClient:
         model: Optional[str] = None,
         timeout: int = 30,
         max_retries: int = 3,
-        enable_cache: bool = True
+        enable_cache: bool = True,
+        max_cache_size: int = 1000,
+        cache_ttl: float = 7 * 24 * 3600,
+        redis_client: Optional[Any] = None,
+        max_concurrent: int = 10,
+        rate_limit_per_sec: Optional[float] = None,
+        persist_path: Optional[Union[str, Path]] = None
     ):
         """
         Initialize the LLM client.
@@ -92,6 +169,19 @@ class LLMClient:
             timeout: Request timeout in seconds.
             max_retries: Maximum retry attempts.
             enable_cache: Whether to cache translations.
+            max_cache_size: Maximum number of cached translations; the
+                least recently used entry is evicted beyond this.
+            cache_ttl: Seconds a cached translation stays valid.
+            redis_client: Optional Redis client (``redis.Redis`` or
+                ``redis.asyncio.Redis``) used as a second-level cache shared
+                between clients and processes. An asyncio client is only
+                used by the async methods; sync calls skip it.
+            max_concurrent: Maximum number of in-flight async requests
+                during batch translation; also sizes the connection pool.
+            rate_limit_per_sec: Maximum API requests per second, shared by
+                sync and async calls (unlimited if None).
+            persist_path: Optional SQLite file (e.g. DEFAULT_STORE_PATH) that
+                keeps cached translations across restarts.
         """
         if not OPENAI_AVAILABLE:
             raise LLMClientError("openai library is required. Install with: pip install openai")
@@ -102,6 +192,13 @@ class LLMClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.enable_cache = enable_cache
+        self.max_cache_size = max_cache_size
+        self.cache_ttl = cache_ttl
+        self.redis_client = redis_client
+        # Set once the sync path finds redis_client returns awaitables
+        self._redis_is_async = False
+        self.max_concurrent = max_concurrent
+        self.rate_limit_per_sec = rate_limit_per_sec
         
         # Initialize clients
         self._sync_client = OpenAI(
@@ -111,15 +208,45 @@ class LLMClient:
         )
         
         self._async_client: Optional[AsyncOpenAI] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._close_task: Optional["asyncio.Task"] = None
+        
+        # Semaphore bounding async batch requests, bound to one event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
         
-        # Cache for translations
-        self._cache: Dict[str, TranslationResult] = {}
+        # LRU cache for translations: key -> (insert time, result)
+        self._cache: "OrderedDict[str, Tuple[float, TranslationResult]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         
-        # Prompt builder
-        self._prompt_builder = PromptBuilder()
+        # Optional on-disk copy of the cache, loaded back on startup
+        self._store: Optional[TranslationStore] = None
+        if persist_path is not None and enable_cache:
+            self._open_store(persist_path)
         
-        # Language detector
-        self._language_detector = LanguageDetector()
+        # Requests in flight, keyed like the cache, so duplicates can share them
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._inflight_async: Dict[str, "asyncio.Task"] = {}
+        self._inflight_async_waiters: Dict["asyncio.Task", int] = {}
+        
+        # Proactive rate limiting, so bursts don't run into 429 responses
+        self._rate_limiter: Optional[TokenBucket] = (
+            TokenBucket(rate_limit_per_sec) if rate_limit_per_sec else None
+        )
+        
+        # Prompt builder, shared so its prompt caches serve every client
+        self._prompt_builder = _PROMPT_BUILDER
+        
+        # The system message is identical for every request, so build it once
+        self._system_message = {
+            "role": "system",
+            "content": self._prompt_builder.get_system_prompt()
+        }
+        
+        # Language detector, shared along with its per-text memo
+        self._language_detector = _LANGUAGE_DETECTOR
+        self._detect_language = _detect_language
     
     def _get_async_client(self) -> AsyncOpenAI:
         """Get or create async client."""
@@ -127,13 +254,201 @@ class LLMClient:
             self._async_client = AsyncOpenAI(
                 api_key=self.api_key,
                 base_url=self.base_url,
-                timeout=self.timeout
+                timeout=self.timeout,
+                http_client=self._create_async_http_client()
             )
+            # Pooled connections are bound to the loop that opens them
+            try:
+                self._async_client_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._async_client_loop = None
         return self._async_client
     
+    def _create_async_http_client(self) -> Optional["httpx.AsyncClient"]:
+        """
+        Create the pooled HTTP client shared by all async requests.
+        
+        The pool is sized from max_concurrent so a full batch never waits on
+        a connection, and idle connections are kept alive between batches.
+        No transport is passed, so proxy environment variables are honored
+        like in the sync client, and redirects are followed as the OpenAI
+        SDK does by default. Returns None to fall back to the OpenAI default
+        when httpx is missing.
+        """
+        if not HTTPX_AVAILABLE:
+            return None
+        
+        limits = httpx.Limits(
+            max_connections=self.max_concurrent * 2,
+            max_keepalive_connections=self.max_concurrent,
+            keepalive_expiry=30
+        )
+        return httpx.AsyncClient(
+            limits=limits,
+            timeout=self.timeout,
+            follow_redirects=True
+        )
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get or create the batch concurrency semaphore for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
     def _get_cache_key(self, text: str, source_lang: str, target_lang: str) -> str:
-        """Generate cache key for a translation."""
-        return f"{source_lang}:{target_lang}:{hash(text)}"
+        """
+        Generate cache key for a translation.
+        
+        Keys have the form ``translate:v2:{model}:{digest}:{source}:{target}``,
+        where digest is a 128-bit BLAKE2b hash of the UTF-8 text. Unlike
+        hash(), it is stable across processes, so keys can be shared or
+        persisted. The model is part of the key so clients using different
+        models don't serve each other's translations from a shared cache.
+        """
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        return (
+            f"translate:{self.CACHE_KEY_VERSION}:{self.model}:"
+            f"{digest}:{source_lang}:{target_lang}"
+        )
+    
+    def _cache_get(self, key: str) -> Optional[TranslationResult]:
+        """Look up a cached translation, dropping it if it has expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, result = entry
+            if time.monotonic() - stored_at >= self.cache_ttl:
+                del self._cache[key]
+                return None
+            
+            self._cache.move_to_end(key)
+            return result
+    
+    def _cache_put(self, key: str, result: TranslationResult) -> None:
+        """Store a translation, evicting the least recently used entries."""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cache_size:
+                self._cache.popitem(last=False)
+        
+        if self._store is not None:
+            self._store.put(key, _dump_result(result))
+    
+    def _open_store(self, path: Union[str, Path]) -> None:
+        """Open the persistent store and warm the cache with its recent entries."""
+        try:
+            self._store = TranslationStore(path)
+            rows = self._store.load(max_age=self.cache_ttl, limit=self.max_cache_size)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Translation cache persistence disabled: {e}")
+            self._store = None
+            return
+        
+        # Map stored wall-clock times onto the monotonic clock used for expiry
+        offset = time.monotonic() - time.time()
+        
+        with self._cache_lock:
+            for key, stored_at, payload in rows:
+                try:
+                    result = _load_result(payload)
+                except (TypeError, ValueError):
+                    continue
+                self._cache[key] = (stored_at + offset, result)
+        
+        logger.debug(f"Loaded {len(self._cache)} cached translations from {path}")
+    
+    def _redis_get(self, key: str) -> Optional[TranslationResult]:
+        """Look up a translation in Redis and copy it into the local cache."""
+        if self.redis_client is None or self._redis_is_async:
+            return None
+        
+        try:
+            payload = self.redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"Redis lookup failed: {e}")
+            return None
+        
+        if self._reject_awaitable(payload):
+            return None
+        
+        return self._load_redis_payload(key, payload)
+    
+    async def _redis_get_async(self, key: str) -> Optional[TranslationResult]:
+        """Async variant of _redis_get; supports sync and asyncio clients."""
+        if self.redis_client is None:
+            return None
+        
+        try:
+            payload = self.redis_client.get(key)
+            if inspect.isawaitable(payload):
+                payload = await payload
+        except Exception as e:
+            logger.warning(f"Redis lookup failed: {e}")
+            return None
+        
+        return self._load_redis_payload(key, payload)
+    
+    def _load_redis_payload(self, key: str, payload: Any) -> Optional[TranslationResult]:
+        """Decode a Redis payload into a TranslationResult."""
+        if payload is None:
+            return None
+        
+        try:
+            result = _load_result(payload)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ignoring invalid Redis cache entry: {e}")
+            return None
+        
+        self._cache_put(key, result)
+        return result
+    
+    def _redis_set(self, key: str, result: TranslationResult) -> None:
+        """Store a translation in Redis; failures are logged and ignored."""
+        if self.redis_client is None or self._redis_is_async:
+            return
+        
+        try:
+            stored = self.redis_client.set(key, _dump_result(result), ex=int(self.cache_ttl))
+        except Exception as e:
+            logger.warning(f"Redis store failed: {e}")
+            return
+        
+        self._reject_awaitable(stored)
+    
+    def _reject_awaitable(self, value: Any) -> bool:
+        """
+        Check for an awaitable returned by an asyncio Redis client in sync code.
+        
+        The awaitable is closed unawaited, and the sync path stops using
+        redis_client from then on; the async methods keep using it.
+        """
+        if not inspect.isawaitable(value):
+            return False
+        
+        close = getattr(value, 'close', None)
+        if close is not None:
+            close()
+        if not self._redis_is_async:
+            logger.warning("redis_client is an asyncio client; sync calls will not use it")
+            self._redis_is_async = True
+        return True
+    
+    async def _redis_set_async(self, key: str, result: TranslationResult) -> None:
+        """Async variant of _redis_set; supports sync and asyncio clients."""
+        if self.redis_client is None:
+            return
+        
+        try:
+            stored = self.redis_client.set(key, _dump_result(result), ex=int(self.cache_ttl))
+            if inspect.isawaitable(stored):
+                await stored
+        except Exception as e:
+            logger.warning(f"Redis store failed: {e}")
     
     def translate(
         self,
@@ -154,33 +469,173 @@ class LLMClient:
         Returns:
             TranslationResult with translated text.
         """
+        # Nothing to translate in numbers, punctuation, symbols or URLs
+        if not self._is_translatable(text):
+            return self._untranslated_result(text, source_lang or target_lang, target_lang)
+        
         # Auto-detect source language if not provided
         if not source_lang:
-            detection = self._language_detector.detect(text)
+            detection = self._detect_language(text)
             source_lang = detection.language
             logger.debug(f"Detected source language: {source_lang} (confidence: {detection.confidence:.2f})")
         
         # Check cache
         if self.enable_cache:
             cache_key = self._get_cache_key(text, source_lang, target_lang)
-            if cache_key in self._cache:
-                cached = self._cache[cache_key]
+            cached = self._cache_get(cache_key) or self._redis_get(cache_key)
+            if cached is not None:
                 cached.cached = True
                 return cached
         
         # Skip translation if source and target are the same
         if source_lang == target_lang:
-            return TranslationResult(
-                original_text=text,
-                translated_text=text,
-                source_language=source_lang,
-                target_language=target_lang,
-                confidence=1.0,
-                model_used=self.model,
-                tokens_used=0,
-                latency_ms=0
+            return self._untranslated_result(text, source_lang, target_lang)
+        
+        if self.enable_cache:
+            return self._request_single_flight(cache_key, text, source_lang, target_lang, style)
+        return self._request_translation(text, source_lang, target_lang, style)
+    
+    async def translate_async(
+        self,
+        text: str,
+        target_lang: str,
+        source_lang: Optional[str] = None,
+        style: Optional[TranslationStyle] = None
+    ) -> TranslationResult:
+        """
+        Translate text asynchronously.
+        
+        Args:
+            text: Text to translate.
+            target_lang: Target language code.
+            source_lang: Source language code (auto-detected if not provided).
+            style: Translation style.
+            
+        Returns:
+            TranslationResult with translated text.
+        """
+        # Nothing to translate in numbers, punctuation, symbols or URLs
+        if not self._is_translatable(text):
+            return self._untranslated_result(text, source_lang or target_lang, target_lang)
+        
+        # Auto-detect source language if not provided
+        if not source_lang:
+            detection = self._detect_language(text)
+            source_lang = detection.language
+        
+        # Check cache
+        if self.enable_cache:
+            cache_key = self._get_cache_key(text, source_lang, target_lang)
+            cached = self._cache_get(cache_key) or await self._redis_get_async(cache_key)
+            if cached is not None:
+                cached.cached = True
+                return cached
+        
+        # Skip translation if source and target are the same
+        if source_lang == target_lang:
+            return self._untranslated_result(text, source_lang, target_lang)
+        
+        if self.enable_cache:
+            return await self._request_single_flight_async(
+                cache_key, text, source_lang, target_lang, style
             )
+        return await self._request_translation_async(text, source_lang, target_lang, style)
+    
+    @staticmethod
+    def _is_translatable(text: str) -> bool:
+        """
+        Check if text contains anything for the model to translate.
         
+        Text without any letters (whitespace, numbers, punctuation, symbols
+        and emoji) and bare URLs are returned unchanged without an API call.
+        """
+        return _RE_HAS_LETTER.search(text) is not None and _RE_BARE_URL.match(text) is None
+    
+    def _untranslated_result(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> TranslationResult:
+        """Build a result that returns the text unchanged, without an API call."""
+        return TranslationResult(
+            original_text=text,
+            translated_text=text,
+            source_language=source_lang,
+            target_language=target_lang,
+            confidence=1.0,
+            model_used=self.model,
+            tokens_used=0,
+            latency_ms=0
+        )
+    
+    @staticmethod
+    def _max_output_tokens(text: str) -> int:
+        """
+        Get the completion token budget for translating text.
+        
+        Input tokens are estimated per script: about four ASCII characters
+        per token, and up to 1.5 tokens per other character (CJK and other
+        scripts tokenize far more densely). The budget leaves room for the
+        translation to be longer than the source.
+        """
+        ascii_chars = len(text.encode('ascii', 'ignore'))
+        input_tokens = ascii_chars / 4 + (len(text) - ascii_chars) * 1.5
+        return int(input_tokens * 2.5) + 64
+    
+    @classmethod
+    def _max_batch_output_tokens(cls, texts: List[str]) -> int:
+        """Get the completion token budget for a numbered batch of texts."""
+        return (
+            cls._max_output_tokens("\n".join(texts))
+            + len(texts) * cls.BATCH_ITEM_OVERHEAD_TOKENS
+        )
+    
+    @classmethod
+    def _retry_delay(cls, attempt: int, error: Exception) -> float:
+        """
+        Get the seconds to wait before retrying a failed request.
+        
+        A Retry-After header on the error response takes precedence, capped
+        at MAX_RETRY_AFTER; otherwise full-jitter exponential backoff (capped
+        at 30s) spreads out retries from concurrent requests instead of
+        having them all retry together.
+        """
+        headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+        retry_after = headers.get('retry-after')
+        delay = None
+        
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    # HTTP-date form
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+        
+        # float() also accepts "nan", which min() and max() can't order
+        if delay is not None and not math.isnan(delay):
+            return min(max(0.0, delay), cls.MAX_RETRY_AFTER)
+        
+        return random.uniform(0, min(2 ** attempt, 30))
+    
+    @staticmethod
+    def _is_server_error(error: Exception) -> bool:
+        """Check if an API error is a retryable 5xx response."""
+        status_code = getattr(error, 'status_code', None)
+        return isinstance(status_code, int) and status_code >= 500
+    
+    def _request_translation(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        style: Optional[TranslationStyle],
+        cache_key: Optional[str] = None
+    ) -> TranslationResult:
+        """Call the API with retry, caching the result under cache_key if given."""
         # Build prompt
         prompt = self._prompt_builder.build_translation_prompt(
             text=text,
@@ -190,18 +645,22 @@ class LLMClient:
         )
         
         # Make API request with retry
+        max_tokens = self._max_output_tokens(text)
         start_time = time.time()
         
         for attempt in range(self.max_retries):
             try:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+                
                 response = self._sync_client.chat.completions.create(
                     model=self.model,
                     messages=[
-                        {"role": "system", "content": self._prompt_builder.get_system_prompt()},
+                        self._system_message,
                         {"role": "user", "content": prompt}
                     ],
                     temperature=0.3,  # Lower temperature for more consistent translations
-                    max_tokens=len(text) * 3  # Rough estimate for output length
+                    max_tokens=max_tokens
                 )
                 
                 latency_ms = (time.time() - start_time) * 1000
@@ -224,16 +683,16 @@ class LLMClient:
                 )
                 
                 # Cache result
-                if self.enable_cache:
-                    self._cache[cache_key] = result
+                if cache_key is not None:
+                    self._cache_put(cache_key, result)
+                    self._redis_set(cache_key, result)
                 
                 return result
                 
             except RateLimitError as e:
                 logger.warning(f"Rate limit hit, attempt {attempt + 1}/{self.max_retries}")
                 if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    time.sleep(wait_time)
+                    time.sleep(self._retry_delay(attempt, e))
                 else:
                     raise LLMClientError(f"Rate limit exceeded after {self.max_retries} attempts: {e}")
                     
@@ -245,55 +704,57 @@ class LLMClient:
                     raise LLMClientError(f"Connection failed after {self.max_retries} attempts: {e}")
                     
             except APIError as e:
-                raise LLMClientError(f"API error: {e}")
+                if self._is_server_error(e) and attempt < self.max_retries - 1:
+                    logger.warning(f"Server error, attempt {attempt + 1}/{self.max_retries}")
+                    time.sleep(self._retry_delay(attempt, e))
+                else:
+                    raise LLMClientError(f"API error: {e}")
         
         raise LLMClientError("Translation failed after all retries")
     
-    async def translate_async(
+    def _request_single_flight(
         self,
+        cache_key: str,
         text: str,
+        source_lang: str,
         target_lang: str,
-        source_lang: Optional[str] = None,
-        style: Optional[TranslationStyle] = None
+        style: Optional[TranslationStyle]
     ) -> TranslationResult:
         """
-        Translate text asynchronously.
+        Call the API, sharing one request between identical concurrent calls.
         
-        Args:
-            text: Text to translate.
-            target_lang: Target language code.
-            source_lang: Source language code (auto-detected if not provided).
-            style: Translation style.
-            
-        Returns:
-            TranslationResult with translated text.
+        The first caller for a key makes the request; callers arriving while
+        it is in flight wait for its result instead of issuing their own.
         """
-        # Auto-detect source language if not provided
-        if not source_lang:
-            detection = self._language_detector.detect(text)
-            source_lang = detection.language
-        
-        # Check cache
-        if self.enable_cache:
-            cache_key = self._get_cache_key(text, source_lang, target_lang)
-            if cache_key in self._cache:
-                cached = self._cache[cache_key]
-                cached.cached = True
-                return cached
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[cache_key] = concurrent.futures.Future()
         
-        # Skip translation if source and target are the same
-        if source_lang == target_lang:
-            return TranslationResult(
-                original_text=text,
-                translated_text=text,
-                source_language=source_lang,
-                target_language=target_lang,
-                confidence=1.0,
-                model_used=self.model,
-                tokens_used=0,
-                latency_ms=0
-            )
+        if not is_owner:
+            return future.result()
         
+        try:
+            result = self._request_translation(text, source_lang, target_lang, style, cache_key)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+    
+    async def _request_translation_async(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        style: Optional[TranslationStyle],
+        cache_key: Optional[str] = None
+    ) -> TranslationResult:
+        """Call the API with retry, caching the result under cache_key if given."""
         # Build prompt
         prompt = self._prompt_builder.build_translation_prompt(
             text=text,
@@ -302,46 +763,52 @@ class LLMClient:
             style=style
         )
         
-        # Make API request with retry
-        client = self._get_async_client()
         start_time = time.time()
+        response = await self._create_completion_async(prompt, self._max_output_tokens(text))
+        latency_ms = (time.time() - start_time) * 1000
+        
+        translated = response.choices[0].message.content.strip()
+        tokens_used = response.usage.total_tokens if response.usage else 0
+        
+        result = TranslationResult(
+            original_text=text,
+            translated_text=translated,
+            source_language=source_lang,
+            target_language=target_lang,
+            confidence=0.95,
+            model_used=self.model,
+            tokens_used=tokens_used,
+            latency_ms=latency_ms
+        )
+        
+        if cache_key is not None:
+            self._cache_put(cache_key, result)
+            await self._redis_set_async(cache_key, result)
+        
+        return result
+    
+    async def _create_completion_async(self, prompt: str, max_tokens: int) -> Any:
+        """Make a chat completion request for a prompt, with retry."""
+        client = self._get_async_client()
         
         for attempt in range(self.max_retries):
             try:
-                response = await client.chat.completions.create(
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire_async()
+                
+                return await client.chat.completions.create(
                     model=self.model,
                     messages=[
-                        {"role": "system", "content": self._prompt_builder.get_system_prompt()},
+                        self._system_message,
                         {"role": "user", "content": prompt}
                     ],
                     temperature=0.3,
-                    max_tokens=len(text) * 3
-                )
-                
-                latency_ms = (time.time() - start_time) * 1000
-                
-                translated = response.choices[0].message.content.strip()
-                tokens_used = response.usage.total_tokens if response.usage else 0
-                
-                result = TranslationResult(
-                    original_text=text,
-                    translated_text=translated,
-                    source_language=source_lang,
-                    target_language=target_lang,
-                    confidence=0.95,
-                    model_used=self.model,
-                    tokens_used=tokens_used,
-                    latency_ms=latency_ms
+                    max_tokens=max_tokens
                 )
                 
-                if self.enable_cache:
-                    self._cache[cache_key] = result
-                
-                return result
-                
-            except RateLimitError:
+            except RateLimitError as e:
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(self._retry_delay(attempt, e))
                 else:
                     raise LLMClientError("Rate limit exceeded")
                     
@@ -352,15 +819,333 @@ class LLMClient:
                     raise LLMClientError("Connection failed")
                     
             except APIError as e:
-                raise LLMClientError(f"API error: {e}")
+                if self._is_server_error(e) and attempt < self.max_retries - 1:
+                    await asyncio.sleep(self._retry_delay(attempt, e))
+                else:
+                    raise LLMClientError(f"API error: {e}")
         
         raise LLMClientError("Translation failed")
     
+    async def _request_single_flight_async(
+        self,
+        cache_key: str,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        style: Optional[TranslationStyle]
+    ) -> TranslationResult:
+        """Async counterpart of _request_single_flight."""
+        loop = asyncio.get_running_loop()
+        task = self._inflight_async.get(cache_key)
+        
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(
+                self._request_translation_async(text, source_lang, target_lang, style, cache_key)
+            )
+            self._inflight_async[cache_key] = task
+            
+            def _forget(done: "asyncio.Task") -> None:
+                if self._inflight_async.get(cache_key) is done:
+                    del self._inflight_async[cache_key]
+            
+            task.add_done_callback(_forget)
+        
+        # Shield so one caller being cancelled doesn't cancel the others,
+        # but cancel the request once nobody is waiting for it any more
+        waiters = self._inflight_async_waiters
+        waiters[task] = waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            waiters[task] -= 1
+            if not waiters[task]:
+                del waiters[task]
+                if not task.done():
+                    if self._inflight_async.get(cache_key) is task:
+                        del self._inflight_async[cache_key]
+                    task.cancel()
+                    # Let it release its connection before the caller moves on
+                    await asyncio.gather(task, return_exceptions=True)
+    
+    async def _translate_bounded(
+        self,
+        index: int,
+        text: str,
+        target_lang: str,
+        source_lang: Optional[str]
+    ) -> Tuple[int, TranslationResult]:
+        """Translate one batch item while holding the concurrency semaphore."""
+        async with self._get_semaphore():
+            return index, await self.translate_async(text, target_lang, source_lang)
+    
+    async def _translate_chunk_async(
+        self,
+        chunk: List[Tuple[int, str]],
+        source_lang: str,
+        target_lang: str
+    ) -> List[Tuple[int, TranslationResult]]:
+        """
+        Translate several (index, text) items with a single API call.
+        
+        Falls back to translating each item separately if the request fails
+        or the response doesn't contain exactly one translation per item.
+        """
+        # Repeated texts are sent once and share the translation
+        texts = list(dict.fromkeys(text for _, text in chunk))
+        
+        if len(texts) > 1:
+            prompt = self._prompt_builder.build_batch_translation_prompt(
+                texts, source_lang, target_lang
+            )
+            start_time = time.time()
+            
+            try:
+                async with self._get_semaphore():
+                    response = await self._create_completion_async(
+                        prompt, self._max_batch_output_tokens(texts)
+                    )
+            except LLMClientError as e:
+                logger.warning(f"Batch translation failed, translating items separately: {e}")
+            else:
+                translations = self._split_batch_response(
+                    response.choices[0].message.content, len(texts)
+                )
+                if translations is not None:
+                    return await self._store_chunk_results(
+                        chunk, dict(zip(texts, translations)), response,
+                        source_lang, target_lang, (time.time() - start_time) * 1000
+                    )
+                logger.warning("Batch response did not match the texts, translating items separately")
+        
+        return await self._gather_cancelling([
+            self._translate_bounded(index, text, target_lang, source_lang)
+            for index, text in chunk
+        ])
+    
+    async def _store_chunk_results(
+        self,
+        chunk: List[Tuple[int, str]],
+        translations: Dict[str, str],
+        response: Any,
+        source_lang: str,
+        target_lang: str,
+        latency_ms: float
+    ) -> List[Tuple[int, TranslationResult]]:
+        """Build and cache results for a batch response, sharing its token usage."""
+        total_tokens = response.usage.total_tokens if response.usage else 0
+        tokens_used = total_tokens // len(translations)
+        stored: Dict[str, TranslationResult] = {}
+        results = []
+        
+        for index, text in chunk:
+            if text in stored:
+                results.append((index, stored[text]))
+                continue
+            
+            result = TranslationResult(
+                original_text=text,
+                translated_text=translations[text],
+                source_language=source_lang,
+                target_language=target_lang,
+                confidence=0.95,
+                model_used=self.model,
+                tokens_used=tokens_used,
+                latency_ms=latency_ms
+            )
+            
+            if self.enable_cache:
+                cache_key = self._get_cache_key(text, source_lang, target_lang)
+                self._cache_put(cache_key, result)
+                await self._redis_set_async(cache_key, result)
+            
+            stored[text] = result
+            results.append((index, result))
+        
+        return results
+    
+    @staticmethod
+    def _split_batch_response(content: Optional[str], count: int) -> Optional[List[str]]:
+        """
+        Split a batch translation response into one translation per text.
+        
+        Accepts translations separated by '---' lines, numbered with the
+        prompt's [i] markers, or both. Returns None if the number of
+        translations doesn't match count.
+        """
+        if not content:
+            return None
+        
+        parts = [part.strip() for part in _RE_BATCH_SEPARATOR.split(content)]
+        parts = [part for part in parts if part]
+        
+        if len(parts) != count:
+            # No usable separators; fall back to the [i] markers
+            parts = [part.strip() for part in _RE_BATCH_MARKER_SPLIT.split(content)]
+            parts = [part for part in parts if part]
+        
+        if len(parts) != count:
+            return None
+        
+        return [_RE_BATCH_MARKER.sub('', part, count=1) for part in parts]
+    
+    async def _plan_batch_chunks(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str],
+        batch_size: int
+    ) -> List[Tuple[List[Tuple[int, str]], str]]:
+        """
+        Group batch texts into chunks translated by one request each.
+        
+        Texts that aren't cached (locally or in Redis) or already being
+        translated are grouped by source language, up to batch_size distinct
+        texts per chunk; repeats of a text join the chunk it is already in.
+        Everything else gets a chunk of its own and goes through
+        translate_async.
+        
+        Returns:
+            List of ([(index, text), ...], source language) chunks.
+        """
+        chunks: List[Tuple[List[Tuple[int, str]], str]] = []
+        groups: Dict[str, List[Tuple[int, str]]] = {}
+        planned: Dict[str, List[Tuple[int, str]]] = {}
+        
+        for index, text in enumerate(texts):
+            if not self._is_translatable(text):
+                chunks.append(([(index, text)], source_lang or target_lang))
+                continue
+            
+            text_lang = source_lang or self._detect_language(text).language
+            cache_key = self._get_cache_key(text, text_lang, target_lang)
+            
+            if cache_key in planned:
+                planned[cache_key].append((index, text))
+                continue
+            
+            if (
+                batch_size <= 1
+                or text_lang == target_lang
+                or (self.enable_cache and await self._is_cached_or_inflight(cache_key))
+            ):
+                # Translated (or returned as-is) on its own by translate_async
+                chunks.append(([(index, text)], text_lang))
+                continue
+            
+            group = groups.setdefault(text_lang, [])
+            group.append((index, text))
+            planned[cache_key] = group
+            if len({item for _, item in group}) == batch_size:
+                chunks.append((group, text_lang))
+                groups[text_lang] = []
+        
+        chunks.extend((group, text_lang) for text_lang, group in groups.items() if group)
+        return chunks
+    
+    async def _is_cached_or_inflight(self, cache_key: str) -> bool:
+        """
+        Check if a translation can be had without a new batch request.
+        
+        A Redis hit is copied into the local cache, so translate_async
+        finds it without another round trip.
+        """
+        if self._cache_get(cache_key) is not None or cache_key in self._inflight_async:
+            return True
+        
+        cached = await self._redis_get_async(cache_key)
+        if cached is None:
+            return False
+        
+        self._cache_put(cache_key, cached)
+        return True
+    
+    async def _run_chunks(
+        self,
+        chunks: List[Tuple[List[Tuple[int, str]], str]],
+        target_lang: str
+    ) -> List[List[Tuple[int, TranslationResult]]]:
+        """Translate all chunks concurrently as one unit of work."""
+        return await self._gather_cancelling([
+            self._translate_chunk_async(chunk, text_lang, target_lang)
+            for chunk, text_lang in chunks
+        ])
+    
+    @staticmethod
+    async def _gather_cancelling(coros: List[Awaitable[Any]]) -> List[Any]:
+        """
+        Run coroutines concurrently, returning their results in order.
+        
+        If any of them fails, or the caller is cancelled, the rest are
+        cancelled and awaited before returning, so no request is left
+        holding a pooled connection. The first error is re-raised as is.
+        """
+        if hasattr(asyncio, 'TaskGroup'):
+            try:
+                async with asyncio.TaskGroup() as group:
+                    tasks = [group.create_task(coro) for coro in coros]
+            except BaseExceptionGroup as e:  # noqa: F821 - only raised on 3.11+
+                raise e.exceptions[0] from None
+            return [task.result() for task in tasks]
+        
+        # Python < 3.11: gather, cancelling and awaiting the rest on failure
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    
+    async def translate_batch_iter_async(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str] = None,
+        batch_size: int = 10
+    ) -> AsyncIterator[Tuple[int, TranslationResult]]:
+        """
+        Translate multiple texts concurrently, yielding results as they finish.
+        
+        Texts that aren't already cached are grouped by source language and
+        sent up to batch_size at a time in a single request. At most
+        ``max_concurrent`` requests are in flight at once, so short texts are
+        not held back behind long ones and large batches do not exhaust the
+        HTTP connection pool.
+        
+        Args:
+            texts: List of texts to translate.
+            target_lang: Target language code.
+            source_lang: Source language code.
+            batch_size: Maximum number of texts per API request.
+            
+        Yields:
+            Tuples of (index into texts, TranslationResult) in completion order.
+        """
+        tasks = [
+            asyncio.ensure_future(self._translate_chunk_async(chunk, text_lang, target_lang))
+            for chunk, text_lang in await self._plan_batch_chunks(
+                texts, target_lang, source_lang, batch_size
+            )
+        ]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for item in await next_done:
+                    yield item
+        finally:
+            # Don't leave requests running if the caller stops early or a
+            # chunk fails; wait for them to release their connections
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
     async def translate_batch_async(
         self,
         texts: List[str],
         target_lang: str,
-        source_lang: Optional[str] = None
+        source_lang: Optional[str] = None,
+        batch_size: int = 10
     ) -> List[TranslationResult]:
         """
         Translate multiple texts concurrently.
@@ -369,31 +1154,32 @@ class LLMClient:
             texts: List of texts to translate.
             target_lang: Target language code.
             source_lang: Source language code.
+            batch_size: Maximum number of texts per API request.
             
         Returns:
-            List of TranslationResult objects.
+            List of TranslationResult objects, in the same order as texts.
         """
-        tasks = [
-            self.translate_async(text, target_lang, source_lang)
-            for text in texts
-        ]
+        chunks = await self._plan_batch_chunks(texts, target_lang, source_lang, batch_size)
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+        
+        for chunk_results in await self._run_chunks(chunks, target_lang):
+            for index, result in chunk_results:
+                results[index] = result
         
-        return await asyncio.gather(*tasks)
+        return results
     
     def validate_connection(self) -> bool:
         """
         Validate API connection.
         
+        Lists the available models, which checks the network and API key
+        without spending tokens or counting against completion rate limits.
+        
         Returns:
             True if connection is valid.
         """
         try:
-            # Make a minimal API call
-            response = self._sync_client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": "Hi"}],
-                max_tokens=5
-            )
+            self._sync_client.models.list()
             return True
         except Exception as e:
             logger.error(f"Connection validation failed: {e}")
@@ -406,8 +1192,12 @@ class LLMClient:
         Returns:
             Number of entries cleared.
         """
-        count = len(self._cache)
-        self._cache.clear()
+        with self._cache_lock:
+            count = len(self._cache)
+            self._cache.clear()
+        
+        if self._store is not None:
+            self._store.clear()
         return count
     
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -419,14 +1209,60 @@ class LLMClient:
         """
         return {
             "entries": len(self._cache),
+            "max_entries": self.max_cache_size,
+            "ttl_seconds": self.cache_ttl,
             "enabled": self.enable_cache
         }
     
     def close(self) -> None:
-        """Close the client and release resources."""
+        """
+        Close the client and release resources.
+        
+        The async client's connections can only be closed gracefully on the
+        event loop that opened them, so prefer ``await aclose()`` on that
+        loop. From inside a running loop, the async client is closed in a
+        background task on it. Outside one, it is closed on its own loop if
+        that loop still exists, and simply dropped if the loop has already
+        been closed (e.g. after ``asyncio.run(client.translate_async(...))``).
+        """
         if self._sync_client:
             self._sync_client.close()
+        if self._store is not None:
+            self._store.close()
         if self._async_client:
-            asyncio.get_event_loop().run_until_complete(
-                self._async_client.close()
-            )
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._close_async_client_on_owner_loop()
+            else:
+                self._close_task = loop.create_task(self._close_async_client())
+    
+    async def aclose(self) -> None:
+        """Close the client and release resources from async code."""
+        if self._sync_client:
+            self._sync_client.close()
+        if self._store is not None:
+            # Flushing and pruning the store blocks on SQLite
+            await asyncio.to_thread(self._store.close)
+        await self._close_async_client()
+    
+    def _close_async_client_on_owner_loop(self) -> None:
+        """Close the async client from sync code, without a running loop."""
+        owner = self._async_client_loop
+        if owner is None:
+            asyncio.run(self._close_async_client())
+        elif owner.is_closed():
+            # Closing the pool would schedule callbacks on the dead loop
+            logger.debug("Dropping async client whose event loop is closed")
+            self._async_client = None
+        elif owner.is_running():
+            # Running in another thread; close there without waiting
+            asyncio.run_coroutine_threadsafe(self._close_async_client(), owner)
+        else:
+            owner.run_until_complete(self._close_async_client())
+    
+    async def _close_async_client(self) -> None:
+        """Close the async client and its connection pool, if created."""
+        client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.close()
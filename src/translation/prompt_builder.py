@@ -6,11 +6,53 @@ Constructs optimal prompts for accurate LLM translation.
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from .language_detector import LANGUAGE_NAMES
 
 
+# Display names per (source, target) code pair, filled in on first use
+_PAIR_NAMES: Dict[Tuple[str, str], Tuple[str, str]] = {}
+
+
+def _language_pair_names(source_lang: str, target_lang: str) -> Tuple[str, str]:
+    """Get the display names for a language pair, falling back to the codes."""
+    pair = (source_lang, target_lang)
+    names = _PAIR_NAMES.get(pair)
+    if names is None:
+        names = _PAIR_NAMES[pair] = (
+            LANGUAGE_NAMES.get(source_lang, source_lang),
+            LANGUAGE_NAMES.get(target_lang, target_lang)
+        )
+    return names
+
+
+@lru_cache(maxsize=256)
+def _translation_header(
+    source_lang: str,
+    target_lang: str,
+    style: "TranslationStyle",
+    preserve_formatting: bool
+) -> str:
+    """Build the language, style and formatting lines of a translation prompt."""
+    source_name, target_name = _language_pair_names(source_lang, target_lang)
+    
+    # Language specification
+    parts = [f"Translate the following text from {source_name} to {target_name}."]
+    
+    # Style instruction
+    style_instruction = PromptBuilder.STYLE_INSTRUCTIONS.get(style, "")
+    if style_instruction:
+        parts.append(style_instruction)
+    
+    # Formatting instruction
+    if preserve_formatting:
+        parts.append("Preserve all formatting including line breaks, bullet points, and numbering.")
+    
+    return "\n".join(parts)
+
+
 class TranslationStyle(Enum):
     """Translation style options."""
     LITERAL = "literal"
@@ -70,6 +112,9 @@ Rules:
         TranslationStyle.TECHNICAL: "Preserve technical terminology precisely.",
     }
     
+    # Final instruction closing every translation prompt
+    TRANSLATION_FOOTER = "Provide ONLY the translation, no explanations or notes."
+    
     def __init__(self, config: Optional[PromptConfig] = None):
         """
         Initialize the prompt builder.
@@ -111,41 +156,16 @@ Rules:
         """
         style = style or self.config.style
         
-        # Get language names
-        source_name = LANGUAGE_NAMES.get(source_lang, source_lang)
-        target_name = LANGUAGE_NAMES.get(target_lang, target_lang)
-        
-        # Build the prompt
-        parts = []
-        
-        # Language specification
-        parts.append(f"Translate the following text from {source_name} to {target_name}.")
-        
-        # Style instruction
-        style_instruction = self.STYLE_INSTRUCTIONS.get(style, "")
-        if style_instruction:
-            parts.append(style_instruction)
-        
-        # Formatting instruction
-        if self.config.preserve_formatting:
-            parts.append("Preserve all formatting including line breaks, bullet points, and numbering.")
+        # Everything before the context and text depends only on a few
+        # low-cardinality settings, so it is built once and reused
+        header = _translation_header(
+            source_lang, target_lang, style, self.config.preserve_formatting
+        )
         
-        # Context if provided
         if context:
-            parts.append(f"Context: {context}")
+            header = f"{header}\nContext: {context}"
         
-        # The text to translate
-        parts.append("")
-        parts.append("Text to translate:")
-        parts.append("---")
-        parts.append(text)
-        parts.append("---")
-        
-        # Final instruction
-        parts.append("")
-        parts.append("Provide ONLY the translation, no explanations or notes.")
-        
-        return "\n".join(parts)
+        return f"{header}\n\nText to translate:\n---\n{text}\n---\n\n{self.TRANSLATION_FOOTER}"
     
     def build_batch_translation_prompt(
         self,
@@ -164,8 +184,7 @@ Rules:
         Returns:
             The formatted prompt string.
         """
-        source_name = LANGUAGE_NAMES.get(source_lang, source_lang)
-        target_name = LANGUAGE_NAMES.get(target_lang, target_lang)
+        source_name, target_name = _language_pair_names(source_lang, target_lang)
         
         parts = [
             f"Translate the following {len(texts)} texts from {source_name} to {target_name}.",
@@ -219,8 +238,7 @@ Language code:"""
         Returns:
             The formatted prompt string.
         """
-        source_name = LANGUAGE_NAMES.get(source_lang, source_lang)
-        target_name = LANGUAGE_NAMES.get(target_lang, target_lang)
+        source_name, target_name = _language_pair_names(source_lang, target_lang)
         
         return f"""Evaluate this translation from {source_name} to {target_name}.
 
@@ -252,11 +270,10 @@ Suggested improvements: [improvements or "None"]"""
         if len(text) <= max_length:
             return text
         
-        # Truncate at word boundary
-        truncated = text[:max_length]
-        last_space = truncated.rfind(' ')
-        
-        if last_space > max_length * 0.8:
-            truncated = truncated[:last_space]
+        # Truncate at a word boundary in the last 20%, searching in place
+        # rather than copying the prefix first
+        cut = text.rfind(' ', int(max_length * 0.8) + 1, max_length)
+        if cut == -1:
+            cut = max_length
         
-        return truncated + "..."
+        return text[:cut] + "..."
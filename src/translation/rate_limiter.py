@@ -0,0 +1,72 @@
+"""
+Rate Limiter
+
+Token-bucket rate limiter for shaping API request rates.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter usable from both threads and coroutines.
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    each request takes one token, waiting for it if the bucket is empty.
+    Waiters reserve their token before sleeping, so concurrent callers are
+    spaced out instead of all waking at once.
+    
+    Usage:
+        limiter = TokenBucket(rate=5)
+        limiter.acquire()              # in sync code
+        await limiter.acquire_async()  # in async code
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum burst size (defaults to one second of tokens,
+                but at least one).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take one token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def acquire(self) -> None:
+        """Block until a request may be made."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be made."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
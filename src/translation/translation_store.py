@@ -0,0 +1,183 @@
+"""
+Translation Store
+
+SQLite-backed persistence for cached translations across restarts.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Default location for the persistent translation cache
+DEFAULT_STORE_PATH = Path.home() / ".cache" / "instant-translator" / "translations.sqlite"
+
+# Queue sentinels for the writer thread
+_CLEAR = object()
+_STOP = object()
+
+
+class TranslationStore:
+    """
+    Persistent key/value store for serialized translations.
+    
+    Entries are kept in a single SQLite table with the time they were
+    stored. Writes are queued and applied by a background thread in
+    batched transactions, so storing a translation never waits on disk.
+    Loading and closing prune the table to the entries load() would
+    return, so it does not grow across restarts.
+    
+    Usage:
+        store = TranslationStore(DEFAULT_STORE_PATH)
+        store.put("translate:v2:...", payload)
+        rows = store.load(max_age=3600, limit=1000)
+        store.close()
+    """
+    
+    # Maximum number of queued writes applied in one transaction
+    MAX_WRITE_BATCH = 256
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (or create) the store.
+        
+        Args:
+            path: Path to the SQLite database file; parent directories
+                are created as needed.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn_lock = threading.Lock()
+        with self._conn_lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(key TEXT PRIMARY KEY, ts REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        
+        # Retention used to prune the table, set by load()
+        self._max_age: Optional[float] = None
+        self._limit: Optional[int] = None
+        self._closed = False
+        
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name="TranslationStoreWriter",
+            daemon=True
+        )
+        self._writer.start()
+    
+    def load(self, max_age: float, limit: int) -> List[Tuple[str, float, str]]:
+        """
+        Load the most recent entries and delete all others.
+        
+        Args:
+            max_age: Maximum entry age in seconds; also used when closing.
+            limit: Maximum number of entries to return and keep; also used
+                when closing.
+        
+        Returns:
+            List of (key, stored time, payload), oldest first.
+        """
+        self._max_age = max_age
+        self._limit = limit
+        
+        with self._conn_lock:
+            self._prune()
+            rows = self._conn.execute(
+                "SELECT key, ts, payload FROM translations ORDER BY ts DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        
+        rows.reverse()
+        return rows
+    
+    def put(self, key: str, payload: str) -> None:
+        """
+        Queue an entry to be written, replacing any entry with the same key.
+        
+        Ignored once the store is closed.
+        """
+        if self._closed:
+            return
+        self._queue.put((key, time.time(), payload))
+    
+    def clear(self) -> None:
+        """Queue removal of all entries (after any writes already queued)."""
+        if self._closed:
+            return
+        self._queue.put(_CLEAR)
+    
+    def flush(self) -> None:
+        """Block until all queued writes have been applied (no-op once closed)."""
+        if self._closed:
+            return
+        self._queue.join()
+    
+    def close(self) -> None:
+        """Apply queued writes, stop the writer thread and close the database."""
+        if self._closed:
+            return
+        self._closed = True
+        
+        self._queue.put(_STOP)
+        self._writer.join()
+        with self._conn_lock:
+            if self._limit is not None:
+                self._prune()
+            self._conn.close()
+    
+    def _prune(self) -> None:
+        """Delete entries older than max_age or beyond the newest limit ones."""
+        cutoff = time.time() - self._max_age
+        self._conn.execute(
+            "DELETE FROM translations WHERE ts <= ? OR key NOT IN "
+            "(SELECT key FROM translations ORDER BY ts DESC LIMIT ?)",
+            (cutoff, self._limit)
+        )
+        self._conn.commit()
+    
+    def _write_loop(self) -> None:
+        """Apply queued writes in batches until stopped."""
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self.MAX_WRITE_BATCH:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._apply(items)
+            except sqlite3.Error as e:
+                logger.warning(f"Persisting translations failed: {e}")
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            
+            if any(item is _STOP for item in items):
+                return
+    
+    def _apply(self, items: List[object]) -> None:
+        """Apply a batch of queued operations in one transaction."""
+        with self._conn_lock:
+            for item in items:
+                if item is _STOP:
+                    break
+                if item is _CLEAR:
+                    self._conn.execute("DELETE FROM translations")
+                else:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO translations (key, ts, payload) VALUES (?, ?, ?)",
+                        item
+                    )
+            self._conn.commit()
@@ -2,18 +2,29 @@
 Pytest configuration and shared fixtures.
 """
 
+import functools
 import os
 import sys
+from collections import namedtuple
 from pathlib import Path
 from typing import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 from PIL import Image
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Plain stand-ins for library return values; unlike MagicMock they have
+# only the fields the code reads and never grow attributes on access
+Screenshot = namedtuple("Screenshot", "size bgra")
+ChatMessage = namedtuple("ChatMessage", "content")
+ChatChoice = namedtuple("ChatChoice", "message")
+CompletionUsage = namedtuple("CompletionUsage", "total_tokens")
+ChatCompletion = namedtuple("ChatCompletion", "choices usage")
+
 
 # =============================================================================
 # Environment Fixtures
@@ -40,65 +51,106 @@ def reset_config():
 # Image Fixtures
 # =============================================================================
 
-@pytest.fixture
+# Read-only pixel arrays shared by the image fixtures, keyed by (size, color)
+_PIXEL_BUFFERS = {}
+
+
+def _solid_image(size, color) -> Image.Image:
+    """Build a solid-color image from a preallocated pixel array."""
+    key = (size, color)
+    pixels = _PIXEL_BUFFERS.get(key)
+    if pixels is None:
+        width, height = size
+        shape = (height, width) if isinstance(color, int) else (height, width, len(color))
+        pixels = np.full(shape, color, dtype=np.uint8)
+        pixels.flags.writeable = False
+        _PIXEL_BUFFERS[key] = pixels
+    return Image.fromarray(pixels)
+
+
+@pytest.fixture(scope="session")
 def sample_image() -> Image.Image:
-    """Create a sample test image."""
-    img = Image.new("RGB", (800, 600), color=(255, 255, 255))
-    return img
+    """Create a sample test image (shared; do not mutate)."""
+    return _solid_image((800, 600), (255, 255, 255))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_with_text() -> Image.Image:
-    """Create a sample image that would contain text (simulated)."""
-    img = Image.new("RGB", (800, 600), color=(255, 255, 255))
+    """Create a sample image that would contain text (shared; do not mutate)."""
     # In a real scenario, this would have actual text
-    return img
+    return _solid_image((800, 600), (255, 255, 255))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def small_image() -> Image.Image:
-    """Create a small image for upscaling tests."""
-    return Image.new("RGB", (100, 75), color=(200, 200, 200))
+    """Create a small image for upscaling tests (shared; do not mutate)."""
+    return _solid_image((100, 75), (200, 200, 200))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def large_image() -> Image.Image:
+    """Create a 2000x1500 white image (shared; do not mutate)."""
+    return _solid_image((2000, 1500), (255, 255, 255))
+
+
+@pytest.fixture(scope="session")
 def grayscale_image() -> Image.Image:
-    """Create a grayscale image."""
-    return Image.new("L", (400, 300), color=128)
+    """Create a grayscale image (shared; call .copy() before mutating)."""
+    return _solid_image((400, 300), 128)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def low_contrast_image() -> Image.Image:
-    """Create a low contrast image."""
-    img = Image.new("RGB", (400, 300), color=(128, 128, 128))
-    return img
+    """Create a low contrast image (shared; do not mutate)."""
+    return _solid_image((400, 300), (128, 128, 128))
 
 
 # =============================================================================
 # Mock Fixtures
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _white_bgra(width: int, height: int) -> bytes:
+    """White BGRA pixel data for a screenshot of the given size."""
+    return b"\xff" * (width * height * 4)
+
+
+class FakeMSS:
+    """Stand-in for mss.mss exposing only what ScreenCapture uses."""
+    
+    monitors = [
+        {"left": 0, "top": 0, "width": 3840, "height": 2160},  # All monitors
+        {"left": 0, "top": 0, "width": 1920, "height": 1080},  # Monitor 1
+        {"left": 1920, "top": 0, "width": 1920, "height": 1080},  # Monitor 2
+    ]
+    
+    def grab(self, region):
+        size = (region["width"], region["height"])
+        return Screenshot(size=size, bgra=_white_bgra(*size))
+    
+    def close(self):
+        pass
+
+
 @pytest.fixture
-def mock_mss():
+def mock_mss(monkeypatch):
     """Mock mss screen capture library."""
-    with patch("mss.mss") as mock:
-        instance = MagicMock()
-        
-        # Mock monitors
-        instance.monitors = [
-            {"left": 0, "top": 0, "width": 3840, "height": 2160},  # All monitors
-            {"left": 0, "top": 0, "width": 1920, "height": 1080},  # Monitor 1
-            {"left": 1920, "top": 0, "width": 1920, "height": 1080},  # Monitor 2
-        ]
-        
-        # Mock grab to return fake screenshot data
-        screenshot = MagicMock()
-        screenshot.size = (1920, 1080)
-        screenshot.bgra = b"\xff" * (1920 * 1080 * 4)  # White pixels
-        instance.grab.return_value = screenshot
-        
-        mock.return_value = instance
-        yield mock
+    monkeypatch.setattr("mss.mss", FakeMSS)
+    return FakeMSS
+
+
+@pytest.fixture(scope="session")
+def screen_capture():
+    """ScreenCapture backed by FakeMSS, shared across the session."""
+    from src.capture import ScreenCapture
+    
+    # mss.mss() is only called on construction, so the patch can end here
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("mss.mss", FakeMSS)
+        capture = ScreenCapture()
+    
+    with capture:
+        yield capture
 
 
 @pytest.fixture
@@ -124,23 +176,31 @@ def mock_win32gui():
         yield win32gui
 
 
+@pytest.fixture(scope="session")
+def _tesseract_stubs():
+    """Configured stand-ins for pytesseract's OCR calls, built once per session."""
+    mock_string = MagicMock(return_value="Sample extracted text")
+    mock_data = MagicMock(return_value={
+        "text": ["Sample", "extracted", "text"],
+        "conf": [95, 92, 98],
+        "left": [10, 100, 200],
+        "top": [10, 10, 10],
+        "width": [80, 90, 60],
+        "height": [20, 20, 20]
+    })
+    return mock_string, mock_data
+
+
 @pytest.fixture
-def mock_tesseract():
+def mock_tesseract(_tesseract_stubs, monkeypatch):
     """Mock pytesseract for OCR."""
-    with patch("pytesseract.image_to_string") as mock_string, \
-         patch("pytesseract.image_to_data") as mock_data:
-        
-        mock_string.return_value = "Sample extracted text"
-        mock_data.return_value = {
-            "text": ["Sample", "extracted", "text"],
-            "conf": [95, 92, 98],
-            "left": [10, 100, 200],
-            "top": [10, 10, 10],
-            "width": [80, 90, 60],
-            "height": [20, 20, 20]
-        }
-        
-        yield mock_string, mock_data
+    mock_string, mock_data = _tesseract_stubs
+    mock_string.reset_mock()
+    mock_data.reset_mock()
+    
+    monkeypatch.setattr("pytesseract.image_to_string", mock_string)
+    monkeypatch.setattr("pytesseract.image_to_data", mock_data)
+    return mock_string, mock_data
 
 
 @pytest.fixture
@@ -156,36 +216,111 @@ def mock_easyocr():
         yield mock_reader
 
 
+@pytest.fixture(scope="session")
+def _openai_stubs():
+    """Configured stand-ins for the OpenAI client classes, built once per session."""
+    mock_sync = MagicMock()
+    mock_async = MagicMock()
+    
+    # Mock sync client
+    sync_instance = MagicMock()
+    response = ChatCompletion(
+        choices=[ChatChoice(message=ChatMessage(content="Translated text"))],
+        usage=CompletionUsage(total_tokens=50)
+    )
+    
+    sync_instance.chat.completions.create.return_value = response
+    mock_sync.return_value = sync_instance
+    
+    # Mock async client similarly, with an awaitable create()
+    async_instance = MagicMock()
+    async_instance.chat.completions.create = AsyncMock(return_value=response)
+    async_instance.close = AsyncMock()
+    mock_async.return_value = async_instance
+    
+    return mock_sync, mock_async
+
+
 @pytest.fixture
-def mock_openai():
+def mock_openai(_openai_stubs, monkeypatch):
     """Mock OpenAI client for LLM API."""
-    with patch("openai.OpenAI") as mock_sync, \
-         patch("openai.AsyncOpenAI") as mock_async:
-        
-        # Mock sync client
-        sync_instance = MagicMock()
-        response = MagicMock()
-        response.choices = [MagicMock()]
-        response.choices[0].message.content = "Translated text"
-        response.usage = MagicMock()
-        response.usage.total_tokens = 50
-        
-        sync_instance.chat.completions.create.return_value = response
-        mock_sync.return_value = sync_instance
-        
-        # Mock async client similarly
-        mock_async.return_value = MagicMock()
-        
-        yield mock_sync, mock_async
+    mock_sync, mock_async = _openai_stubs
+    mock_sync.reset_mock()
+    mock_async.reset_mock()
+    
+    # llm_client imports the classes by name, so patch its references too
+    for target in ("openai", "src.translation.llm_client"):
+        monkeypatch.setattr(f"{target}.OpenAI", mock_sync)
+        monkeypatch.setattr(f"{target}.AsyncOpenAI", mock_async)
+    return mock_sync, mock_async
 
 
 # =============================================================================
-# Sample Data Fixtures
+# Shared Object Fixtures
 # =============================================================================
 
+@pytest.fixture(scope="module")
+def default_preprocessor():
+    """ImagePreprocessor with the default config, shared within a module."""
+    from src.ocr.image_preprocessor import ImagePreprocessor
+    return ImagePreprocessor()
+
+
 @pytest.fixture
+def isolated_preprocessor():
+    """Fresh ImagePreprocessor for tests that inspect or change its state."""
+    from src.ocr.image_preprocessor import ImagePreprocessor
+    return ImagePreprocessor()
+
+
+@pytest.fixture(scope="session")
+def default_detector():
+    """
+    LanguageDetector with the default fallback, shared across the session.
+    
+    detect() is memoized, so the same sample text is only run through the
+    detection model once; detect_batch() goes through the same cache.
+    """
+    from src.translation.language_detector import LanguageDetector
+    
+    detector = LanguageDetector()
+    detector.detect = functools.lru_cache(maxsize=256)(detector.detect)
+    return detector
+
+
+@pytest.fixture(scope="module")
+def tesseract_only_ocr_engine():
+    """OCREngine restricted to Tesseract, shared within a module."""
+    from src.ocr import OCREngine
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.ocr.ocr_engine.EASYOCR_AVAILABLE", False)
+        yield OCREngine(use_easyocr=False)
+
+
+@pytest.fixture(scope="module")
+def llm_client(_openai_stubs):
+    """
+    LLMClient backed by the OpenAI stubs, shared within a module.
+    
+    Its translation cache is shared too, so an input already translated
+    by an earlier test in the module is answered without another request.
+    """
+    from src.translation import LLMClient
+    
+    mock_sync, _ = _openai_stubs
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.translation.llm_client.OpenAI", mock_sync)
+        yield LLMClient(api_key="test-key")
+
+
+# =============================================================================
+# Sample Data Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
 def sample_texts():
-    """Sample texts for testing."""
+    """Sample texts for testing (shared; do not mutate)."""
     return {
         "english": "Hello, how are you today?",
         "japanese": "こんにちは、今日はお元気ですか？",
@@ -198,6 +333,12 @@ def sample_texts():
     }
 
 
+@pytest.fixture(scope="session")
+def precomputed_detections(default_detector, sample_texts):
+    """Detection result for each of sample_texts, computed once per session."""
+    return {key: default_detector.detect(text) for key, text in sample_texts.items()}
+
+
 @pytest.fixture
 def ocr_error_cases():
     """Common OCR error patterns for testing."""
@@ -227,3 +368,13 @@ def temp_image_file(tmp_path, sample_image) -> Path:
     img_path = tmp_path / "test_image.png"
     sample_image.save(img_path)
     return img_path
+
+
+# =============================================================================
+# Assertion Helpers
+# =============================================================================
+
+def assert_all_in(needles, haystack) -> None:
+    """Assert that every needle occurs in haystack, reporting all misses at once."""
+    missing = [needle for needle in needles if needle not in haystack]
+    assert not missing, f"missing from output: {missing}"
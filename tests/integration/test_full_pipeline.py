@@ -1,142 +1,66 @@
 """Integration tests for the full translation pipeline."""
 
 import pytest
-from unittest.mock import MagicMock, patch
-from PIL import Image
+
+from src.ocr import TextProcessor
+from src.translation import PromptBuilder
 
 
 @pytest.mark.integration
 class TestCaptureToOCR:
     """Integration tests for capture to OCR pipeline."""
     
-    def test_capture_and_preprocess(self, mock_mss, sample_image):
+    def test_capture_and_preprocess(self, screen_capture, default_preprocessor):
         """Test capturing and preprocessing an image."""
-        from src.capture import ScreenCapture
-        from src.ocr import ImagePreprocessor
+        result = screen_capture.capture_monitor(0)
+        
+        processed = default_preprocessor.process(result.image)
         
-        with ScreenCapture() as capture:
-            result = capture.capture_monitor(0)
-            
-            preprocessor = ImagePreprocessor()
-            processed = preprocessor.process(result.image)
-            
-            assert processed is not None
-            assert processed.mode == "L"  # Grayscale
+        assert processed.mode == "L"  # Grayscale
     
-    def test_capture_region_and_ocr(self, mock_mss, mock_tesseract):
+    def test_capture_region_and_ocr(
+        self, screen_capture, mock_tesseract, tesseract_only_ocr_engine
+    ):
         """Test capturing a region and extracting text."""
-        from src.capture import ScreenCapture
-        from src.ocr import OCREngine
+        result = screen_capture.capture_region(0, 0, 800, 600)
+        
+        ocr_result = tesseract_only_ocr_engine.extract_text(result.image)
         
-        with ScreenCapture() as capture:
-            result = capture.capture_region(0, 0, 800, 600)
-            
-            # Mock OCR engine that only uses tesseract
-            with patch("src.ocr.ocr_engine.EASYOCR_AVAILABLE", False):
-                engine = OCREngine(use_easyocr=False)
-                ocr_result = engine.extract_text(result.image)
-                
-                assert ocr_result.text != ""
+        assert ocr_result.text != ""
 
 
 @pytest.mark.integration
 class TestOCRToTranslation:
     """Integration tests for OCR to translation pipeline."""
     
-    def test_text_extraction_and_detection(self, sample_image, mock_tesseract):
+    def test_text_extraction_and_detection(
+        self, sample_image, mock_tesseract, tesseract_only_ocr_engine, default_detector
+    ):
         """Test extracting text and detecting language."""
-        from src.ocr import OCREngine, TextProcessor
-        from src.translation import LanguageDetector
+        ocr_result = tesseract_only_ocr_engine.extract_text(sample_image)
         
-        with patch("src.ocr.ocr_engine.EASYOCR_AVAILABLE", False):
-            engine = OCREngine(use_easyocr=False)
-            ocr_result = engine.extract_text(sample_image)
-            
-            processor = TextProcessor()
-            processed = processor.process(ocr_result.text)
-            
-            detector = LanguageDetector()
-            detection = detector.detect(processed.processed)
-            
-            assert detection.language is not None
+        processor = TextProcessor()
+        processed = processor.process(ocr_result.text)
+        
+        detection = default_detector.detect(processed.processed)
+        
+        assert detection.language
     
-    def test_ocr_to_translation_prompt(self, sample_image, mock_tesseract):
+    def test_ocr_to_translation_prompt(
+        self, sample_image, mock_tesseract, tesseract_only_ocr_engine, default_detector
+    ):
         """Test building translation prompt from OCR result."""
-        from src.ocr import OCREngine
-        from src.translation import PromptBuilder, LanguageDetector
+        ocr_result = tesseract_only_ocr_engine.extract_text(sample_image)
         
-        with patch("src.ocr.ocr_engine.EASYOCR_AVAILABLE", False):
-            engine = OCREngine(use_easyocr=False)
-            ocr_result = engine.extract_text(sample_image)
-            
-            detector = LanguageDetector()
-            detection = detector.detect(ocr_result.text)
-            
-            builder = PromptBuilder()
-            prompt = builder.build_translation_prompt(
-                text=ocr_result.text,
-                source_lang=detection.language,
-                target_lang="en"
-            )
-            
-            assert len(prompt) > 0
-            assert ocr_result.text in prompt or "Sample" in prompt
-
-
-@pytest.mark.integration
-class TestFullPipeline:
-    """Integration tests for the complete pipeline."""
-    
-    def test_capture_ocr_translate(self, mock_mss, mock_tesseract, mock_openai):
-        """Test the complete capture -> OCR -> translate pipeline."""
-        from src.capture import ScreenCapture
-        from src.ocr import OCREngine
-        from src.translation import LLMClient
+        detection = default_detector.detect(ocr_result.text)
         
-        with ScreenCapture() as capture:
-            # Capture
-            capture_result = capture.capture_monitor(0)
-            assert capture_result.image is not None
-            
-            # OCR
-            with patch("src.ocr.ocr_engine.EASYOCR_AVAILABLE", False):
-                engine = OCREngine(use_easyocr=False)
-                ocr_result = engine.extract_text(capture_result.image)
-                assert ocr_result.text != ""
-                
-                # Translate
-                client = LLMClient(api_key="test-key")
-                translation = client.translate(
-                    text=ocr_result.text,
-                    target_lang="ja"
-                )
-                
-                assert translation.is_successful
-    
-    def test_pipeline_with_text_processing(self, mock_tesseract, mock_openai, sample_image):
-        """Test pipeline including text processing."""
-        from src.ocr import OCREngine, TextProcessor
-        from src.translation import LLMClient, LanguageDetector
+        builder = PromptBuilder()
+        prompt = builder.build_translation_prompt(
+            text=ocr_result.text,
+            source_lang=detection.language,
+            target_lang="en"
+        )
         
-        with patch("src.ocr.ocr_engine.EASYOCR_AVAILABLE", False):
-            # OCR
-            engine = OCREngine(use_easyocr=False)
-            ocr_result = engine.extract_text(sample_image)
-            
-            # Process text
-            processor = TextProcessor()
-            processed = processor.process(ocr_result.text)
-            
-            # Detect language
-            detector = LanguageDetector()
-            detection = detector.detect(processed.processed)
-            
-            # Translate
-            client = LLMClient(api_key="test-key")
-            translation = client.translate(
-                text=processed.processed,
-                target_lang="en",
-                source_lang=detection.language
-            )
-            
-            assert translation.translated_text != ""
+        assert len(prompt) > 0
+        assert ocr_result.text in prompt or "Sample" in prompt
+
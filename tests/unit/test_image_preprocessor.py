@@ -4,14 +4,14 @@ import numpy as np
 import pytest
 from PIL import Image
 
+from src.ocr.image_preprocessor import ImagePreprocessor, PreprocessingConfig
+
 
 class TestPreprocessingConfig:
     """Tests for PreprocessingConfig dataclass."""
     
     def test_default_config(self):
         """Test default configuration values."""
-        from src.ocr.image_preprocessor import PreprocessingConfig
-        
         config = PreprocessingConfig()
         
         assert config.upscale_factor == 2.0
@@ -21,8 +21,6 @@ class TestPreprocessingConfig:
     
     def test_custom_config(self):
         """Test custom configuration."""
-        from src.ocr.image_preprocessor import PreprocessingConfig
-        
         config = PreprocessingConfig(
             upscale_factor=3.0,
             apply_binarize=True,
@@ -37,17 +35,12 @@ class TestPreprocessingConfig:
 class TestImagePreprocessor:
     """Tests for ImagePreprocessor class."""
     
-    def test_preprocessor_init_default(self):
+    def test_preprocessor_init_default(self, isolated_preprocessor):
         """Test default initialization."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
-        preprocessor = ImagePreprocessor()
-        assert preprocessor.config is not None
+        assert isolated_preprocessor.config is not None
     
     def test_preprocessor_init_custom_config(self):
         """Test initialization with custom config."""
-        from src.ocr.image_preprocessor import ImagePreprocessor, PreprocessingConfig
-        
         config = PreprocessingConfig(upscale_factor=1.5)
         preprocessor = ImagePreprocessor(config)
         
@@ -55,8 +48,6 @@ class TestImagePreprocessor:
     
     def test_upscale_image(self, small_image):
         """Test image upscaling."""
-        from src.ocr.image_preprocessor import ImagePreprocessor, PreprocessingConfig
-        
         config = PreprocessingConfig(upscale_factor=2.0)
         preprocessor = ImagePreprocessor(config)
         
@@ -67,8 +58,6 @@ class TestImagePreprocessor:
     
     def test_upscale_no_change_when_factor_1(self, sample_image):
         """Test that upscale factor 1.0 doesn't change image."""
-        from src.ocr.image_preprocessor import ImagePreprocessor, PreprocessingConfig
-        
         config = PreprocessingConfig(upscale_factor=1.0)
         preprocessor = ImagePreprocessor(config)
         
@@ -76,74 +65,53 @@ class TestImagePreprocessor:
         
         assert result.size == sample_image.size
     
-    def test_to_grayscale(self, sample_image):
+    def test_to_grayscale(self, sample_image, default_preprocessor):
         """Test grayscale conversion."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
-        preprocessor = ImagePreprocessor()
-        result = preprocessor.to_grayscale(sample_image)
+        result = default_preprocessor.to_grayscale(sample_image)
         
         assert result.mode == "L"
     
-    def test_to_grayscale_already_gray(self, grayscale_image):
+    def test_to_grayscale_already_gray(self, grayscale_image, default_preprocessor):
         """Test grayscale conversion on already gray image."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
-        preprocessor = ImagePreprocessor()
-        result = preprocessor.to_grayscale(grayscale_image)
+        result = default_preprocessor.to_grayscale(grayscale_image)
         
         assert result.mode == "L"
         assert result.size == grayscale_image.size
     
-    def test_enhance_contrast(self, sample_image):
+    def test_enhance_contrast(self, sample_image, default_preprocessor):
         """Test contrast enhancement."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
-        preprocessor = ImagePreprocessor()
-        result = preprocessor.enhance_contrast(sample_image)
+        result = default_preprocessor.enhance_contrast(sample_image)
         
         assert result is not None
         assert result.size == sample_image.size
     
-    def test_sharpen(self, sample_image):
+    def test_sharpen(self, sample_image, default_preprocessor):
         """Test image sharpening."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
-        preprocessor = ImagePreprocessor()
-        result = preprocessor.sharpen(sample_image)
+        result = default_preprocessor.sharpen(sample_image)
         
         assert result is not None
         assert result.size == sample_image.size
     
-    def test_denoise(self, sample_image):
+    def test_denoise(self, sample_image, default_preprocessor):
         """Test image denoising."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
-        preprocessor = ImagePreprocessor()
-        result = preprocessor.denoise(sample_image)
+        result = default_preprocessor.denoise(sample_image)
         
         assert result is not None
         assert result.size == sample_image.size
     
-    def test_binarize(self, grayscale_image):
+    def test_binarize(self, grayscale_image, default_preprocessor):
         """Test image binarization."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
-        preprocessor = ImagePreprocessor()
-        result = preprocessor.binarize(grayscale_image)
+        result = default_preprocessor.binarize(grayscale_image)
         
         assert result is not None
         assert result.mode == "L"
         
         # Check that pixels are only black or white
-        pixels = list(result.getdata())
-        unique_values = set(pixels)
-        assert unique_values.issubset({0, 255})
+        arr = np.asarray(result)
+        assert np.isin(np.unique(arr), [0, 255]).all()
     
     def test_full_process_pipeline(self, sample_image):
         """Test the full preprocessing pipeline."""
-        from src.ocr.image_preprocessor import ImagePreprocessor, PreprocessingConfig
-        
         config = PreprocessingConfig(
             apply_upscale=True,
             apply_grayscale=True,
@@ -162,8 +130,6 @@ class TestImagePreprocessor:
     
     def test_process_preserves_mode_when_grayscale_disabled(self, sample_image):
         """Test that mode is preserved when grayscale is disabled."""
-        from src.ocr.image_preprocessor import ImagePreprocessor, PreprocessingConfig
-        
         config = PreprocessingConfig(
             apply_upscale=False,
             apply_grayscale=False,
@@ -179,24 +145,16 @@ class TestImagePreprocessor:
         
         assert result.mode == sample_image.mode
     
-    def test_get_optimal_config_small_image(self, small_image):
+    def test_get_optimal_config_small_image(self, small_image, default_preprocessor):
         """Test optimal config generation for small images."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
-        preprocessor = ImagePreprocessor()
-        config = preprocessor.get_optimal_config_for_image(small_image)
+        config = default_preprocessor.get_optimal_config_for_image(small_image)
         
         # Small images should have higher upscale factor
         assert config.upscale_factor >= 1.5
     
-    def test_get_optimal_config_large_image(self):
+    def test_get_optimal_config_large_image(self, large_image, default_preprocessor):
         """Test optimal config generation for large images."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
-        large_image = Image.new("RGB", (2000, 1500), color=(255, 255, 255))
-        
-        preprocessor = ImagePreprocessor()
-        config = preprocessor.get_optimal_config_for_image(large_image)
+        config = default_preprocessor.get_optimal_config_for_image(large_image)
         
         # Large images should not be upscaled
         assert config.apply_upscale is False
@@ -206,25 +164,19 @@ class TestDeskewing:
     """Tests for deskew functionality."""
     
     @pytest.mark.skip(reason="Requires OpenCV")
-    def test_deskew_rotated_image(self):
+    def test_deskew_rotated_image(self, default_preprocessor):
         """Test deskewing a rotated image."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
         # Create a slightly rotated image
         img = Image.new("RGB", (400, 300), color=(255, 255, 255))
         rotated = img.rotate(5, expand=True)
         
-        preprocessor = ImagePreprocessor()
-        result = preprocessor.deskew(rotated)
+        result = default_preprocessor.deskew(rotated)
         
         assert result is not None
     
-    def test_deskew_straight_image(self, sample_image):
+    def test_deskew_straight_image(self, sample_image, default_preprocessor):
         """Test deskew on already straight image."""
-        from src.ocr.image_preprocessor import ImagePreprocessor
-        
-        preprocessor = ImagePreprocessor()
-        result = preprocessor.deskew(sample_image)
+        result = default_preprocessor.deskew(sample_image)
         
         # Should return similar dimensions
         assert abs(result.width - sample_image.width) < 10
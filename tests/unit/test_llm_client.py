@@ -1,7 +1,76 @@
 """Unit tests for LLM client module."""
 
+import asyncio
+import gc
+import json
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock
+
+import httpx
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
+from openai import BadRequestError, InternalServerError, RateLimitError
+
+from src.translation import llm_client
+from src.translation.llm_client import LLMClient, LLMClientError, TranslationResult
+
+# Canned chat-completion responses; shared read-only by the tests below
+_FAKE_TRANSLATE_RESPONSE = SimpleNamespace(
+    choices=[SimpleNamespace(message=SimpleNamespace(content="Translated text"))],
+    usage=SimpleNamespace(total_tokens=50)
+)
+_FAKE_RESPONSE = SimpleNamespace(
+    choices=[SimpleNamespace(message=SimpleNamespace(content="Translated"))],
+    usage=SimpleNamespace(total_tokens=50)
+)
+_FAKE_RESPONSE_NO_USAGE = SimpleNamespace(
+    choices=[SimpleNamespace(message=SimpleNamespace(content="Translated"))],
+    usage=None
+)
+
+
+class _ChatCompletionHandler(BaseHTTPRequestHandler):
+    """Answers every POST with a fixed chat completion over keep-alive HTTP/1.1."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "test",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "Hallo"}
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def chat_server():
+    """Local HTTP server speaking the chat completions API; yields its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
 
 
 class TestTranslationResult:
@@ -9,8 +78,6 @@ class TestTranslationResult:
     
     def test_translation_result_creation(self):
         """Test creating a TranslationResult instance."""
-        from src.translation.llm_client import TranslationResult
-        
         result = TranslationResult(
             original_text="Hello",
             translated_text="こんにちは",
@@ -25,8 +92,6 @@ class TestTranslationResult:
     
     def test_is_successful_empty(self):
         """Test is_successful with empty translation."""
-        from src.translation.llm_client import TranslationResult
-        
         result = TranslationResult(
             original_text="Hello",
             translated_text="",
@@ -37,86 +102,655 @@ class TestTranslationResult:
         )
         
         assert result.is_successful is False
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_serialization_round_trip(self, use_orjson, monkeypatch):
+        """Test cache payload serialization with and without orjson."""
+        if use_orjson and not llm_client.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        
+        result = TranslationResult(
+            original_text="Hello",
+            translated_text="こんにちは",
+            source_language="en",
+            target_language="ja",
+            confidence=0.95,
+            model_used="test",
+            tokens_used=12
+        )
+        
+        monkeypatch.setattr(llm_client, "ORJSON_AVAILABLE", use_orjson)
+        payload = llm_client._dump_result(result)
+        assert llm_client._load_result(payload) == result
+        assert llm_client._load_result(payload.encode("utf-8")) == result
 
 
 class TestLLMClient:
     """Tests for LLMClient class."""
     
+    @pytest.fixture(scope="class", autouse=True)
+    def _openai_class(self):
+        """Patch the sync OpenAI client class once for every test in the class."""
+        with pytest.MonkeyPatch.context() as mp:
+            mock_openai = MagicMock()
+            mp.setattr("src.translation.llm_client.OpenAI", mock_openai)
+            yield mock_openai
+    
+    @pytest.fixture(autouse=True)
+    def openai_client(self, _openai_class):
+        """Reset the shared OpenAI client mock and give it a default response."""
+        mock_instance = _openai_class.return_value
+        mock_instance.reset_mock(side_effect=True)
+        mock_instance.chat.completions.create.return_value = _FAKE_RESPONSE
+        return mock_instance
+    
     def test_client_init(self):
         """Test LLM client initialization."""
-        with patch("src.translation.llm_client.OpenAI"):
-            from src.translation.llm_client import LLMClient
-            
-            client = LLMClient(api_key="test-key")
-            assert client.api_key == "test-key"
+        client = LLMClient(api_key="test-key")
+        assert client.api_key == "test-key"
     
-    def test_translate_basic(self):
+    def test_translate_basic(self, openai_client):
         """Test basic translation."""
-        with patch("src.translation.llm_client.OpenAI") as mock_openai:
-            # Setup the mock
-            mock_instance = MagicMock()
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock()]
-            mock_response.choices[0].message.content = "Translated text"
-            mock_response.usage = MagicMock()
-            mock_response.usage.total_tokens = 50
-            mock_instance.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_instance
-            
-            from src.translation.llm_client import LLMClient
-            
-            client = LLMClient(api_key="test-key")
-            result = client.translate("Hello", "ja", "en")
-            
-            assert result is not None
-            assert result.translated_text == "Translated text"
+        openai_client.chat.completions.create.return_value = _FAKE_TRANSLATE_RESPONSE
+        
+        client = LLMClient(api_key="test-key")
+        result = client.translate("Hello", "ja", "en")
+        
+        assert result.translated_text == "Translated text"
     
     def test_translate_same_language(self):
         """Test translation when source and target are the same."""
-        with patch("src.translation.llm_client.OpenAI"):
-            from src.translation.llm_client import LLMClient
-            
-            client = LLMClient(api_key="test-key")
-            result = client.translate("Hello", "en", "en")
-            
-            assert result.translated_text == "Hello"
+        client = LLMClient(api_key="test-key")
+        result = client.translate("Hello", "en", "en")
+        
+        assert result.translated_text == "Hello"
+        assert result.tokens_used == 0
+    
+    def test_translate_skips_untranslatable_text(self, openai_client):
+        """Test that numbers, punctuation and URLs are returned without an API call."""
+        client = LLMClient(api_key="test-key")
+        
+        for text in ["12,345", "!!! ...", "😀", "https://example.com/page"]:
+            result = client.translate(text, "ja")
+            assert result.translated_text == text
             assert result.tokens_used == 0
+        
+        openai_client.chat.completions.create.assert_not_called()
+        assert client._is_translatable("Hello 123") is True
+    
+    def test_language_detection_is_memoized(self, openai_client):
+        """Test that the source language of a repeated text is detected once."""
+        openai_client.chat.completions.create.return_value = _FAKE_RESPONSE_NO_USAGE
+        
+        client = LLMClient(api_key="test-key")
+        client._detect_language.cache_clear()
+        client.translate("Good morning everyone", "ja")
+        client.translate("Good morning everyone", "ko")
+        
+        assert client._detect_language.cache_info().hits == 1
+    
+    def test_helpers_are_shared_between_clients(self):
+        """Test that clients share one prompt builder and language detector."""
+        first = LLMClient(api_key="test-key")
+        second = LLMClient(api_key="other-key")
+        
+        assert first._prompt_builder is second._prompt_builder
+        assert first._language_detector is second._language_detector
     
     def test_cache_operations(self):
         """Test cache operations."""
-        with patch("src.translation.llm_client.OpenAI") as mock_openai:
-            # Setup the mock
-            mock_instance = MagicMock()
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock()]
-            mock_response.choices[0].message.content = "Translated"
-            mock_response.usage = MagicMock()
-            mock_response.usage.total_tokens = 50
-            mock_instance.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_instance
-            
-            from src.translation.llm_client import LLMClient
-            
-            client = LLMClient(api_key="test-key", enable_cache=True)
+        client = LLMClient(api_key="test-key", enable_cache=True)
+        
+        # First call
+        result1 = client.translate("Hello", "ja", "en")
+        
+        # Second call should be cached
+        result2 = client.translate("Hello", "ja", "en")
+        assert result2.cached is True
+        
+        # Clear cache
+        count = client.clear_cache()
+        assert count == 1
+    
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays within max_cache_size."""
+        client = LLMClient(api_key="test-key", max_cache_size=2)
+        
+        client.translate("One", "ja", "en")
+        client.translate("Two", "ja", "en")
+        client.translate("One", "ja", "en")  # Refresh "One"
+        client.translate("Three", "ja", "en")  # Evicts "Two"
+        
+        assert client.get_cache_stats()["entries"] == 2
+        assert client.translate("One", "ja", "en").cached is True
+        assert client.translate("Two", "ja", "en").cached is False
+    
+    def test_cache_entries_expire(self, openai_client):
+        """Test that cached translations expire after cache_ttl."""
+        client = LLMClient(api_key="test-key", cache_ttl=0)
+        
+        client.translate("Hello", "ja", "en")
+        result = client.translate("Hello", "ja", "en")
+        
+        assert result.cached is False
+        assert openai_client.chat.completions.create.call_count == 2
+    
+    def test_cache_key_is_stable(self):
+        """Test that cache keys are content digests, not salted hashes."""
+        client = LLMClient(api_key="test-key")
+        key = client._get_cache_key("Hello", "en", "ja")
+        
+        assert key == (
+            "translate:v2:deepseek/deepseek-v3.2:ad10196e1159e75dd6be7d03f75be04f:en:ja"
+        )
+        assert key != client._get_cache_key("Hello", "en", "ko")
+    
+    def test_cache_key_includes_model(self):
+        """Test that clients using different models don't share cache entries."""
+        default = LLMClient(api_key="test-key")
+        other = LLMClient(api_key="test-key", model="openai/gpt-4o-mini")
+        
+        assert default._get_cache_key("Hello", "en", "ja") != other._get_cache_key("Hello", "en", "ja")
+    
+    def test_redis_cache_hit_skips_api(self, openai_client):
+        """Test that a Redis hit is returned without calling the API."""
+        store = {}
+        redis_client = MagicMock()
+        redis_client.get.side_effect = store.get
+        redis_client.set.side_effect = lambda key, value, ex: store.__setitem__(key, value)
+        
+        # First client populates Redis
+        LLMClient(api_key="test-key", redis_client=redis_client).translate("Hello", "ja", "en")
+        assert len(store) == 1
+        
+        # A fresh client is served from Redis
+        result = LLMClient(api_key="test-key", redis_client=redis_client).translate("Hello", "ja", "en")
+        
+        assert result.cached is True
+        assert result.translated_text == "Translated"
+        assert openai_client.chat.completions.create.call_count == 1
+    
+    def test_redis_errors_fall_back_to_api(self):
+        """Test that Redis failures do not break translation."""
+        redis_client = MagicMock()
+        redis_client.get.side_effect = ConnectionError("down")
+        redis_client.set.side_effect = ConnectionError("down")
+        
+        client = LLMClient(api_key="test-key", redis_client=redis_client)
+        result = client.translate("Hello", "ja", "en")
+        
+        assert result.translated_text == "Translated"
+    
+    async def test_async_redis_client_is_skipped_by_sync_calls(self, monkeypatch):
+        """Test that sync calls leave an asyncio Redis client to the async methods."""
+        store = {}
+        
+        class AsyncRedis:
+            calls = 0
             
-            # First call
-            result1 = client.translate("Hello", "ja", "en")
+            async def get(self, key):
+                AsyncRedis.calls += 1
+                return store.get(key)
             
-            # Second call should be cached
-            result2 = client.translate("Hello", "ja", "en")
-            assert result2.cached is True
+            async def set(self, key, value, ex):
+                AsyncRedis.calls += 1
+                store[key] = value
+        
+        client = LLMClient(api_key="test-key", redis_client=AsyncRedis())
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            client.translate("Hello", "ja", "en")
+            client.translate("Goodbye", "ja", "en")
+            gc.collect()
+        
+        assert store == {}
+        assert AsyncRedis.calls == 0
+        assert client._redis_is_async is True
+        
+        mock_async_instance = MagicMock()
+        mock_async_instance.chat.completions.create = AsyncMock(return_value=_FAKE_RESPONSE)
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", MagicMock(return_value=mock_async_instance))
+        
+        await client.translate_async("Welcome", "ja", "en")
+        assert len(store) == 1
+    
+    async def test_translate_batch_async_bounds_concurrency(self, monkeypatch):
+        """Test that batch translation limits in-flight requests and keeps order."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_create(**_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
             
-            # Clear cache
-            count = client.clear_cache()
-            assert count == 1
+            return _FAKE_RESPONSE_NO_USAGE
+        
+        mock_async_openai = MagicMock()
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", mock_async_openai)
+        mock_instance = MagicMock()
+        mock_instance.chat.completions.create = AsyncMock(side_effect=fake_create)
+        mock_async_openai.return_value = mock_instance
+        
+        client = LLMClient(api_key="test-key", enable_cache=False, max_concurrent=2)
+        texts = [f"Text {i}" for i in range(6)]
+        results = await client.translate_batch_async(texts, "ja", "en", batch_size=1)
+        
+        assert [r.original_text for r in results] == texts
+        assert peak == 2
+    
+    async def test_translate_batch_async_single_request(self, monkeypatch):
+        """Test that short texts are translated together in one request."""
+        mock_async_openai = MagicMock()
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", mock_async_openai)
+        mock_response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="[1] Eins\n---\n[2] Zwei\n---\n[3] Drei"))],
+            usage=SimpleNamespace(total_tokens=90)
+        )
+        mock_instance = MagicMock()
+        mock_instance.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_async_openai.return_value = mock_instance
+        
+        client = LLMClient(api_key="test-key")
+        results = await client.translate_batch_async(["One", "Two", "Three"], "de", "en")
+        
+        assert [r.translated_text for r in results] == ["Eins", "Zwei", "Drei"]
+        assert [r.tokens_used for r in results] == [30, 30, 30]
+        assert mock_instance.chat.completions.create.await_count == 1
+        assert client.translate("Two", "de", "en").cached is True
+    
+    async def test_translate_batch_async_budgets_for_markers(self, monkeypatch):
+        """Test that a batch of one-word texts leaves room for the echoed markers."""
+        words = [f"Word{i}" for i in range(40)]
+        content = "\n---\n".join(f"[{i}] Wort{i - 1}" for i in range(1, 41))
+        mock_instance = MagicMock()
+        mock_instance.chat.completions.create = AsyncMock(return_value=SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=None
+        ))
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", MagicMock(return_value=mock_instance))
+        
+        client = LLMClient(api_key="test-key")
+        results = await client.translate_batch_async(words, "de", "en", batch_size=40)
+        
+        # "[i] Wort.." plus the "---" separator is at least 6 tokens per item
+        max_tokens = mock_instance.chat.completions.create.call_args.kwargs["max_tokens"]
+        assert max_tokens >= 6 * len(words)
+        assert mock_instance.chat.completions.create.await_count == 1
+        assert results[-1].translated_text == "Wort39"
+    
+    async def test_translate_batch_async_falls_back_on_mismatch(self, monkeypatch):
+        """Test that a malformed batch response is retried item by item."""
+        mock_async_openai = MagicMock()
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", mock_async_openai)
+        mock_instance = MagicMock()
+        mock_instance.chat.completions.create = AsyncMock(return_value=_FAKE_RESPONSE_NO_USAGE)
+        mock_async_openai.return_value = mock_instance
+        
+        client = LLMClient(api_key="test-key")
+        results = await client.translate_batch_async(["One", "Two"], "de", "en")
+        
+        assert [r.translated_text for r in results] == ["Translated", "Translated"]
+        assert mock_instance.chat.completions.create.await_count == 3
+    
+    async def test_translate_batch_async_sends_repeated_texts_once(self, monkeypatch):
+        """Test that repeated texts in a batch share one translation."""
+        mock_instance = MagicMock()
+        mock_instance.chat.completions.create = AsyncMock(return_value=SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="[1] Eins\n---\n[2] Zwei"))],
+            usage=SimpleNamespace(total_tokens=90)
+        ))
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", MagicMock(return_value=mock_instance))
+        
+        client = LLMClient(api_key="test-key")
+        results = await client.translate_batch_async(["One", "Two", "One"], "de", "en")
+        
+        assert [r.translated_text for r in results] == ["Eins", "Zwei", "Eins"]
+        assert [r.tokens_used for r in results] == [45, 45, 45]
+        assert mock_instance.chat.completions.create.await_count == 1
+    
+    async def test_translate_batch_async_skips_redis_hits(self, monkeypatch):
+        """Test that texts already in Redis are left out of the batch request."""
+        store = {}
+        redis_client = MagicMock()
+        redis_client.get.side_effect = store.get
+        redis_client.set.side_effect = lambda key, value, ex: store.__setitem__(key, value)
+        
+        mock_instance = MagicMock()
+        mock_instance.chat.completions.create = AsyncMock(side_effect=[
+            _FAKE_RESPONSE,
+            SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content="[1] Eins\n---\n[2] Drei"))],
+                usage=None
+            )
+        ])
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", MagicMock(return_value=mock_instance))
+        
+        # Another client has already translated "Two"
+        await LLMClient(api_key="test-key", redis_client=redis_client).translate_async("Two", "de", "en")
+        
+        client = LLMClient(api_key="test-key", redis_client=redis_client)
+        results = await client.translate_batch_async(["One", "Two", "Three"], "de", "en")
+        
+        assert [r.translated_text for r in results] == ["Eins", "Translated", "Drei"]
+        assert results[1].cached is True
+        assert mock_instance.chat.completions.create.await_count == 2
+    
+    async def test_translate_batch_async_joins_inflight_requests(self, monkeypatch):
+        """Test that a text already being translated is not sent again."""
+        async def fake_create(**kwargs):
+            await asyncio.sleep(0.01)
+            if "2 texts" in kwargs["messages"][1]["content"]:
+                return SimpleNamespace(
+                    choices=[SimpleNamespace(message=SimpleNamespace(content="[1] Eins\n---\n[2] Drei"))],
+                    usage=None
+                )
+            return _FAKE_RESPONSE_NO_USAGE
+        
+        mock_instance = MagicMock()
+        mock_instance.chat.completions.create = AsyncMock(side_effect=fake_create)
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", MagicMock(return_value=mock_instance))
+        
+        client = LLMClient(api_key="test-key")
+        single = asyncio.ensure_future(client.translate_async("Two", "de", "en"))
+        await asyncio.sleep(0)
+        results = await client.translate_batch_async(["One", "Two", "Three"], "de", "en")
+        
+        assert [r.translated_text for r in results] == ["Eins", "Translated", "Drei"]
+        assert (await single).translated_text == "Translated"
+        assert mock_instance.chat.completions.create.await_count == 2
+    
+    def test_split_batch_response(self):
+        """Test splitting batch responses by separators or markers."""
+        assert LLMClient._split_batch_response("A\n---\nB", 2) == ["A", "B"]
+        assert LLMClient._split_batch_response("[1] A\n[2] B\nC", 2) == ["A", "B\nC"]
+        assert LLMClient._split_batch_response("A\n---\nB", 3) is None
+        assert LLMClient._split_batch_response(None, 1) is None
+    
+    @pytest.mark.parametrize("enable_cache, batch_size", [
+        (False, 1),
+        (True, 3),
+    ], ids=["per-item", "batch-fallback"])
+    async def test_translate_batch_async_cancels_on_failure(
+        self, monkeypatch, enable_cache, batch_size
+    ):
+        """Test that a failing request cancels the rest of the batch."""
+        cancelled = []
+        
+        async def fake_create(**kwargs):
+            if "Bad" in kwargs["messages"][1]["content"]:
+                raise BadRequestError(
+                    "bad request",
+                    response=httpx.Response(
+                        400, request=httpx.Request("POST", "https://example.com")
+                    ),
+                    body=None
+                )
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        
+        mock_async_openai = MagicMock()
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", mock_async_openai)
+        mock_instance = MagicMock()
+        mock_instance.chat.completions.create = AsyncMock(side_effect=fake_create)
+        mock_async_openai.return_value = mock_instance
+        
+        client = LLMClient(api_key="test-key", enable_cache=enable_cache)
+        
+        with pytest.raises(LLMClientError):
+            await asyncio.wait_for(
+                client.translate_batch_async(
+                    ["Slow one", "Bad one", "Slow two"], "ja", "en", batch_size=batch_size
+                ),
+                timeout=5
+            )
+        
+        assert len(cancelled) == 2
+        assert not client._inflight_async
+    
+    def test_duplicate_threaded_requests_are_coalesced(self, openai_client):
+        """Test that identical translations from several threads share one API call."""
+        def slow_create(**_kwargs):
+            time.sleep(0.2)
+            return _FAKE_RESPONSE_NO_USAGE
+        
+        openai_client.chat.completions.create.side_effect = slow_create
+        client = LLMClient(api_key="test-key")
+        barrier = threading.Barrier(5)
+        
+        def translate():
+            barrier.wait()
+            return client.translate("Hello", "ja", "en")
+        
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(lambda _: translate(), range(5)))
+        
+        assert all(r.translated_text == "Translated" for r in results)
+        assert openai_client.chat.completions.create.call_count == 1
+        assert client._inflight == {}
+    
+    async def test_duplicate_in_flight_requests_are_coalesced(self, monkeypatch):
+        """Test that identical concurrent translations share one API call."""
+        async def fake_create(**_kwargs):
+            await asyncio.sleep(0.01)
+            return _FAKE_RESPONSE_NO_USAGE
+        
+        mock_async_openai = MagicMock()
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", mock_async_openai)
+        mock_instance = MagicMock()
+        mock_instance.chat.completions.create = AsyncMock(side_effect=fake_create)
+        mock_async_openai.return_value = mock_instance
+        
+        client = LLMClient(api_key="test-key")
+        results = await asyncio.gather(
+            *(client.translate_async("Hello", "ja", "en") for _ in range(5))
+        )
+        
+        assert all(r.translated_text == "Translated" for r in results)
+        assert mock_instance.chat.completions.create.await_count == 1
+        assert client._inflight_async == {}
+    
+    async def test_cancelled_waiter_does_not_cancel_shared_request(self, monkeypatch):
+        """Test that a shared request keeps running while anyone awaits it."""
+        async def fake_create(**_kwargs):
+            await asyncio.sleep(0.05)
+            return _FAKE_RESPONSE_NO_USAGE
+        
+        mock_async_openai = MagicMock()
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", mock_async_openai)
+        mock_instance = MagicMock()
+        mock_instance.chat.completions.create = AsyncMock(side_effect=fake_create)
+        mock_async_openai.return_value = mock_instance
+        
+        client = LLMClient(api_key="test-key")
+        first = asyncio.ensure_future(client.translate_async("Hello", "ja", "en"))
+        second = asyncio.ensure_future(client.translate_async("Hello", "ja", "en"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        
+        result = await second
+        
+        assert first.cancelled()
+        assert result.translated_text == "Translated"
+        assert mock_instance.chat.completions.create.await_count == 1
+        assert client._inflight_async_waiters == {}
+    
+    def test_max_output_tokens(self):
+        """Test the completion budget scales with script density."""
+        english = LLMClient._max_output_tokens("a" * 400)
+        japanese = LLMClient._max_output_tokens("あ" * 400)
+        
+        assert english == 314
+        assert japanese == 1564
+        assert LLMClient._max_output_tokens("") == 64
+    
+    def test_retry_delay(self):
+        """Test that Retry-After is honored and backoff is jittered."""
+        request = httpx.Request("POST", "https://example.com")
+        with_header = RateLimitError(
+            "rate limited",
+            response=httpx.Response(429, headers={"Retry-After": "7"}, request=request),
+            body=None
+        )
+        without_header = RateLimitError(
+            "rate limited",
+            response=httpx.Response(429, request=request),
+            body=None
+        )
+        
+        assert LLMClient._retry_delay(0, with_header) == 7.0
+        assert all(0 <= LLMClient._retry_delay(2, without_header) <= 4 for _ in range(20))
+        assert LLMClient._retry_delay(10, without_header) <= 30
+    
+    @pytest.mark.parametrize("retry_after", [
+        "86400",
+        "inf",
+        "Fri, 31 Dec 2100 23:59:59 GMT",
+    ])
+    def test_retry_delay_caps_retry_after(self, retry_after):
+        """Test that a huge Retry-After header is capped."""
+        error = RateLimitError(
+            "rate limited",
+            response=httpx.Response(
+                429,
+                headers={"Retry-After": retry_after},
+                request=httpx.Request("POST", "https://example.com")
+            ),
+            body=None
+        )
+        
+        assert LLMClient._retry_delay(0, error) == LLMClient.MAX_RETRY_AFTER
+    
+    def test_server_errors_are_retried(self, monkeypatch, openai_client):
+        """Test that 5xx responses are retried instead of failing immediately."""
+        mock_sleep = MagicMock()
+        monkeypatch.setattr(llm_client.time, "sleep", mock_sleep)
+        server_error = InternalServerError(
+            "server error",
+            response=httpx.Response(
+                500, request=httpx.Request("POST", "https://example.com")
+            ),
+            body=None
+        )
+        openai_client.chat.completions.create.side_effect = [server_error, _FAKE_RESPONSE_NO_USAGE]
+        
+        client = LLMClient(api_key="test-key")
+        result = client.translate("Hello", "ja", "en")
+        
+        assert result.translated_text == "Translated"
+        assert openai_client.chat.completions.create.call_count == 2
+        mock_sleep.assert_called_once()
+    
+    def test_validate_connection(self, openai_client):
+        """Test that validation lists models instead of requesting a completion."""
+        client = LLMClient(api_key="test-key")
+        assert client.validate_connection() is True
+        openai_client.models.list.assert_called_once()
+        openai_client.chat.completions.create.assert_not_called()
+        
+        openai_client.models.list.side_effect = Exception("401 Unauthorized")
+        assert client.validate_connection() is False
+    
+    def test_close_outside_event_loop(self, monkeypatch, openai_client):
+        """Test that close() shuts down both clients without a running loop."""
+        mock_async_openai = MagicMock()
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", mock_async_openai)
+        mock_async_instance = MagicMock()
+        mock_async_instance.close = AsyncMock()
+        mock_async_openai.return_value = mock_async_instance
+        
+        client = LLMClient(api_key="test-key")
+        client._get_async_client()
+        client.close()
+        
+        openai_client.close.assert_called_once()
+        mock_async_instance.close.assert_awaited_once()
+        assert client._async_client is None
+    
+    async def test_async_http_client_uses_env_proxy(self, monkeypatch):
+        """Test that the pooled async HTTP client honors HTTPS_PROXY like the sync one."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        client = LLMClient(api_key="test-key")
+        
+        http_client = client._create_async_http_client()
+        try:
+            assert http_client.follow_redirects is True
+            proxied = http_client._transport_for_url(httpx.URL("https://zenmux.ai/api/v1"))
+            assert proxied is not http_client._transport
+        finally:
+            await http_client.aclose()
+    
+    def test_close_after_event_loop_finished(self, chat_server):
+        """Test close() once the loop that opened the connection pool is gone."""
+        client = LLMClient(api_key="test-key", base_url=chat_server, enable_cache=False)
+        result = asyncio.run(client.translate_async("Hello", "de", "en"))
+        
+        client.close()
+        
+        assert result.translated_text == "Hallo"
+        assert client._async_client is None
+    
+    async def test_aclose(self, monkeypatch):
+        """Test closing the client from async code."""
+        mock_async_openai = MagicMock()
+        monkeypatch.setattr(llm_client, "AsyncOpenAI", mock_async_openai)
+        mock_async_instance = MagicMock()
+        mock_async_instance.close = AsyncMock()
+        mock_async_openai.return_value = mock_async_instance
+        
+        client = LLMClient(api_key="test-key")
+        client._get_async_client()
+        await client.aclose()
+        
+        mock_async_instance.close.assert_awaited_once()
+        assert "http_client" in mock_async_openai.call_args.kwargs
+    
+    def test_cache_persists_across_clients(self, openai_client, tmp_path):
+        """Test that cached translations are restored from persist_path."""
+        path = tmp_path / "translations.sqlite"
+        client = LLMClient(api_key="test-key", persist_path=path)
+        client.translate("Hello", "ja", "en")
+        client.close()
+        
+        restarted = LLMClient(api_key="test-key", persist_path=path)
+        result = restarted.translate("Hello", "ja", "en")
+        restarted.close()
+        
+        assert result.cached is True
+        assert result.translated_text == "Translated"
+        assert openai_client.chat.completions.create.call_count == 1
+    
+    async def test_aclose_closes_store_off_the_event_loop(self, openai_client, tmp_path):
+        """Test that aclose flushes the store in a worker thread."""
+        path = tmp_path / "translations.sqlite"
+        client = LLMClient(api_key="test-key", persist_path=path)
+        client.translate("Hello", "ja", "en")
+        
+        close_threads = []
+        store_close = client._store.close
+        
+        def recording_close():
+            close_threads.append(threading.current_thread())
+            store_close()
+        
+        client._store.close = recording_close
+        await client.aclose()
+        
+        assert close_threads and close_threads[0] is not threading.current_thread()
+        restarted = LLMClient(api_key="test-key", persist_path=path)
+        assert restarted.translate("Hello", "ja", "en").cached is True
+        restarted.close()
     
     def test_get_cache_stats(self):
         """Test getting cache statistics."""
-        with patch("src.translation.llm_client.OpenAI"):
-            from src.translation.llm_client import LLMClient
-            
-            client = LLMClient(api_key="test-key", enable_cache=True)
-            stats = client.get_cache_stats()
-            
-            assert "entries" in stats
-            assert "enabled" in stats
+        client = LLMClient(api_key="test-key", enable_cache=True)
+        stats = client.get_cache_stats()
+        
+        assert "entries" in stats
+        assert "enabled" in stats
@@ -2,14 +2,46 @@
 
 import pytest
 
+from src.translation.prompt_builder import (
+    PromptBuilder,
+    PromptConfig,
+    TranslationStyle,
+    _PAIR_NAMES,
+    _language_pair_names,
+    _translation_header,
+)
+from tests.conftest import assert_all_in
+
+
+@pytest.fixture(scope="class")
+def builder():
+    """Default-config PromptBuilder shared by the tests of one class."""
+    return PromptBuilder()
+
+
+@pytest.fixture(scope="session")
+def prompt_cache():
+    """Translation prompts built so far in the session, keyed by arguments."""
+    return {}
+
+
+@pytest.fixture
+def translation_prompt(builder, prompt_cache):
+    """Build a default-config translation prompt once per set of arguments."""
+    def get_prompt(**kwargs):
+        key = tuple(sorted(kwargs.items()))
+        if key not in prompt_cache:
+            prompt_cache[key] = builder.build_translation_prompt(**kwargs)
+        return prompt_cache[key]
+    
+    return get_prompt
+
 
 class TestPromptConfig:
     """Tests for PromptConfig dataclass."""
     
     def test_default_config(self):
         """Test default configuration."""
-        from src.translation.prompt_builder import PromptConfig, TranslationStyle
-        
         config = PromptConfig()
         
         assert config.style == TranslationStyle.NATURAL
@@ -18,8 +50,6 @@ class TestPromptConfig:
     
     def test_custom_config(self):
         """Test custom configuration."""
-        from src.translation.prompt_builder import PromptConfig, TranslationStyle
-        
         config = PromptConfig(
             style=TranslationStyle.FORMAL,
             preserve_formatting=False,
@@ -34,15 +64,16 @@ class TestPromptConfig:
 class TestTranslationStyle:
     """Tests for TranslationStyle enum."""
     
-    def test_style_values(self):
+    @pytest.mark.parametrize("name,value", [
+        ("LITERAL", "literal"),
+        ("NATURAL", "natural"),
+        ("FORMAL", "formal"),
+        ("CASUAL", "casual"),
+        ("TECHNICAL", "technical"),
+    ])
+    def test_style_values(self, name, value):
         """Test that all expected styles exist."""
-        from src.translation.prompt_builder import TranslationStyle
-        
-        assert TranslationStyle.LITERAL.value == "literal"
-        assert TranslationStyle.NATURAL.value == "natural"
-        assert TranslationStyle.FORMAL.value == "formal"
-        assert TranslationStyle.CASUAL.value == "casual"
-        assert TranslationStyle.TECHNICAL.value == "technical"
+        assert TranslationStyle[name].value == value
 
 
 class TestPromptBuilder:
@@ -50,36 +81,26 @@ class TestPromptBuilder:
     
     def test_builder_init_default(self):
         """Test default initialization."""
-        from src.translation.prompt_builder import PromptBuilder
-        
         builder = PromptBuilder()
         assert builder.config is not None
     
     def test_builder_init_custom_config(self):
         """Test initialization with custom config."""
-        from src.translation.prompt_builder import PromptBuilder, PromptConfig, TranslationStyle
-        
         config = PromptConfig(style=TranslationStyle.FORMAL)
         builder = PromptBuilder(config)
         
         assert builder.config.style == TranslationStyle.FORMAL
     
-    def test_get_system_prompt(self):
+    def test_get_system_prompt(self, builder):
         """Test getting the system prompt."""
-        from src.translation.prompt_builder import PromptBuilder
-        
-        builder = PromptBuilder()
         system_prompt = builder.get_system_prompt()
         
         assert len(system_prompt) > 0
         assert "translator" in system_prompt.lower()
     
-    def test_build_translation_prompt_basic(self):
+    def test_build_translation_prompt_basic(self, translation_prompt):
         """Test basic translation prompt building."""
-        from src.translation.prompt_builder import PromptBuilder
-        
-        builder = PromptBuilder()
-        prompt = builder.build_translation_prompt(
+        prompt = translation_prompt(
             text="Hello, world!",
             source_lang="en",
             target_lang="ja"
@@ -91,8 +112,6 @@ class TestPromptBuilder:
     
     def test_build_translation_prompt_with_style(self):
         """Test prompt building with specific style."""
-        from src.translation.prompt_builder import PromptBuilder, TranslationStyle
-        
         builder = PromptBuilder()
         prompt = builder.build_translation_prompt(
             text="Hello",
@@ -103,11 +122,8 @@ class TestPromptBuilder:
         
         assert "formal" in prompt.lower()
     
-    def test_build_translation_prompt_with_context(self):
+    def test_build_translation_prompt_with_context(self, builder):
         """Test prompt building with context."""
-        from src.translation.prompt_builder import PromptBuilder
-        
-        builder = PromptBuilder()
         prompt = builder.build_translation_prompt(
             text="Submit",
             source_lang="en",
@@ -117,12 +133,9 @@ class TestPromptBuilder:
         
         assert "button" in prompt.lower() or "Context" in prompt
     
-    def test_build_translation_prompt_formatting_instruction(self):
+    def test_build_translation_prompt_formatting_instruction(self, translation_prompt):
         """Test that formatting instruction is included by default."""
-        from src.translation.prompt_builder import PromptBuilder
-        
-        builder = PromptBuilder()
-        prompt = builder.build_translation_prompt(
+        prompt = translation_prompt(
             text="Test",
             source_lang="en",
             target_lang="ja"
@@ -130,11 +143,19 @@ class TestPromptBuilder:
         
         assert "formatting" in prompt.lower() or "Preserve" in prompt
     
-    def test_build_batch_translation_prompt(self):
-        """Test batch translation prompt building."""
-        from src.translation.prompt_builder import PromptBuilder
+    def test_translation_prompt_header_is_reused(self, builder):
+        """Test that the prompt header is built once per language pair and style."""
+        _translation_header.cache_clear()
         
-        builder = PromptBuilder()
+        first = builder.build_translation_prompt("One", "en", "ja")
+        second = builder.build_translation_prompt("Two", "en", "ja")
+        PromptBuilder().build_translation_prompt("Three", "en", "ja")
+        
+        assert _translation_header.cache_info().hits == 2
+        assert first.replace("One", "Two") == second
+    
+    def test_build_batch_translation_prompt(self, builder):
+        """Test batch translation prompt building."""
         texts = ["Hello", "Goodbye", "Thank you"]
         
         prompt = builder.build_batch_translation_prompt(
@@ -144,24 +165,17 @@ class TestPromptBuilder:
         )
         
         assert "3 texts" in prompt
-        for text in texts:
-            assert text in prompt
+        assert_all_in(texts, prompt)
     
-    def test_build_detection_prompt(self):
+    def test_build_detection_prompt(self, builder):
         """Test language detection prompt building."""
-        from src.translation.prompt_builder import PromptBuilder
-        
-        builder = PromptBuilder()
         prompt = builder.build_detection_prompt("こんにちは")
         
         assert "こんにちは" in prompt
         assert "language" in prompt.lower()
     
-    def test_build_quality_check_prompt(self):
+    def test_build_quality_check_prompt(self, builder):
         """Test translation quality check prompt building."""
-        from src.translation.prompt_builder import PromptBuilder
-        
-        builder = PromptBuilder()
         prompt = builder.build_quality_check_prompt(
             original="Hello",
             translation="こんにちは",
@@ -174,22 +188,16 @@ class TestPromptBuilder:
         assert "English" in prompt
         assert "Japanese" in prompt
     
-    def test_truncate_text_short(self):
+    def test_truncate_text_short(self, builder):
         """Test truncation of short text (no change)."""
-        from src.translation.prompt_builder import PromptBuilder
-        
-        builder = PromptBuilder()
         text = "Short text"
         
         result = builder.truncate_text(text, max_length=100)
         
         assert result == text
     
-    def test_truncate_text_long(self):
+    def test_truncate_text_long(self, builder):
         """Test truncation of long text."""
-        from src.translation.prompt_builder import PromptBuilder
-        
-        builder = PromptBuilder()
         text = "A" * 1000
         
         result = builder.truncate_text(text, max_length=100)
@@ -197,11 +205,8 @@ class TestPromptBuilder:
         assert len(result) <= 103  # 100 + "..."
         assert result.endswith("...")
     
-    def test_truncate_text_at_word_boundary(self):
+    def test_truncate_text_at_word_boundary(self, builder):
         """Test truncation at word boundary."""
-        from src.translation.prompt_builder import PromptBuilder
-        
-        builder = PromptBuilder()
         text = "This is a test sentence that should be truncated at a word boundary"
         
         result = builder.truncate_text(text, max_length=30)
@@ -215,25 +220,23 @@ class TestPromptBuilder:
 class TestPromptLanguageMapping:
     """Tests for language name mapping in prompts."""
     
-    def test_common_language_names(self):
+    @pytest.mark.parametrize("source,target,source_name,target_name", [
+        ("en", "ja", "English", "Japanese"),
+        ("en", "zh-cn", "English", "Chinese (Simplified)"),
+        ("ja", "ko", "Japanese", "Korean"),
+    ])
+    def test_common_language_names(self, translation_prompt, source, target, source_name, target_name):
         """Test that common languages are properly named in prompts."""
-        from src.translation.prompt_builder import PromptBuilder
-        
-        builder = PromptBuilder()
+        prompt = translation_prompt(
+            text="Test",
+            source_lang=source,
+            target_lang=target
+        )
         
-        # Test various language pairs
-        test_cases = [
-            ("en", "ja", "English", "Japanese"),
-            ("en", "zh-cn", "English", "Chinese (Simplified)"),
-            ("ja", "ko", "Japanese", "Korean"),
-        ]
-        
-        for source, target, source_name, target_name in test_cases:
-            prompt = builder.build_translation_prompt(
-                text="Test",
-                source_lang=source,
-                target_lang=target
-            )
-            
-            assert source_name in prompt
-            assert target_name in prompt
+        assert source_name in prompt
+        assert target_name in prompt
+    
+    def test_unknown_language_codes_are_kept(self):
+        """Test that unknown codes are used as-is and pair names are memoized."""
+        assert _language_pair_names("en", "xx") == ("English", "xx")
+        assert _PAIR_NAMES[("en", "xx")] == ("English", "xx")
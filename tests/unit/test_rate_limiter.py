@@ -0,0 +1,39 @@
+"""Unit tests for rate limiter module."""
+
+import time
+
+import pytest
+
+from src.translation.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket class."""
+    
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+    
+    def test_burst_within_capacity(self):
+        """Test that requests within capacity do not wait."""
+        limiter = TokenBucket(rate=10)
+        
+        assert all(limiter._reserve() == 0.0 for _ in range(10))
+    
+    def test_waits_when_empty(self):
+        """Test that requests beyond capacity are spaced at the rate."""
+        limiter = TokenBucket(rate=10, capacity=1)
+        limiter._reserve()
+        
+        assert limiter._reserve() == pytest.approx(0.1, abs=0.01)
+        assert limiter._reserve() == pytest.approx(0.2, abs=0.01)
+    
+    async def test_acquire_async(self):
+        """Test async acquisition waits for a token."""
+        limiter = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire_async()
+        
+        assert time.monotonic() - start >= 0.035
@@ -0,0 +1,79 @@
+"""Unit tests for translation store module."""
+
+from src.translation.translation_store import TranslationStore
+
+
+class TestTranslationStore:
+    """Tests for TranslationStore class."""
+    
+    def test_put_and_load(self, tmp_path):
+        """Test that stored entries are loaded back, oldest first."""
+        store = TranslationStore(tmp_path / "cache" / "translations.sqlite")
+        store.put("a", "payload-a")
+        store.put("b", "payload-b")
+        store.put("a", "payload-a2")
+        store.flush()
+        
+        rows = store.load(max_age=3600, limit=10)
+        store.close()
+        
+        assert [(key, payload) for key, _, payload in rows] == [
+            ("b", "payload-b"),
+            ("a", "payload-a2"),
+        ]
+    
+    def test_load_limit_and_expiry(self, tmp_path):
+        """Test that load honors the entry limit and drops expired entries."""
+        store = TranslationStore(tmp_path / "translations.sqlite")
+        for key in ("a", "b", "c"):
+            store.put(key, key)
+        store.flush()
+        
+        assert [row[0] for row in store.load(max_age=3600, limit=2)] == ["b", "c"]
+        assert store.load(max_age=0, limit=10) == []
+        store.close()
+    
+    def test_clear_and_reopen(self, tmp_path):
+        """Test that entries persist across reopening until cleared."""
+        path = tmp_path / "translations.sqlite"
+        store = TranslationStore(path)
+        store.put("a", "payload")
+        store.close()
+        
+        store = TranslationStore(path)
+        assert len(store.load(max_age=3600, limit=10)) == 1
+        store.clear()
+        store.flush()
+        assert store.load(max_age=3600, limit=10) == []
+        store.close()
+    
+    def test_load_prunes_entries_beyond_limit(self, tmp_path):
+        """Test that rows not returned by load are deleted, also on close."""
+        path = tmp_path / "translations.sqlite"
+        store = TranslationStore(path)
+        for key in ("a", "b", "c"):
+            store.put(key, key)
+        store.flush()
+        store.load(max_age=3600, limit=2)
+        store.put("d", "d")
+        store.close()
+        
+        store = TranslationStore(path)
+        assert [row[0] for row in store.load(max_age=3600, limit=10)] == ["c", "d"]
+        store.close()
+    
+    def test_put_and_flush_after_close(self, tmp_path):
+        """Test that writes after close are ignored instead of hanging."""
+        path = tmp_path / "translations.sqlite"
+        store = TranslationStore(path)
+        store.put("a", "payload")
+        store.close()
+        
+        store.put("b", "payload")
+        store.clear()
+        store.flush()
+        store.close()
+        
+        store = TranslationStore(path)
+        assert [row[0] for row in store.load(max_age=3600, limit=10)] == ["a"]
+        store.close()